@@ -40,7 +40,8 @@ setup(
             "flake8>=4.0.0",
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
-            "pytest-asyncio>=0.18.0",
+            "pytest-asyncio>=1.0.0",
+            "pytest-xdist>=3.0.0",
             "mypy>=0.950",
         ],
     },
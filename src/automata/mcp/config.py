@@ -12,31 +12,36 @@ from ..core.logger import get_logger
 logger = get_logger(__name__)
 
 
+# Default settings, built once at import; each instance copies the sections
+_DEFAULT_CONFIG: Dict[str, Dict[str, Any]] = {
+    "server": {
+        "url": "ws://localhost:8080",
+        "timeout": 30000,
+        "retry_attempts": 3,
+        "retry_delay": 1000
+    },
+    "bridge": {
+        "extension_mode": False,
+        "extension_port": 9222
+    },
+    "bridge_extension": {
+        "extension_id": None,
+        "websocket_url": "ws://localhost:9222",
+        "connection_timeout": 30000,
+        "retry_attempts": 3,
+        "retry_delay": 1000,
+        "auth_token": None
+    }
+}
+
+
 class MCPConfiguration:
     """Configuration class for MCP Bridge settings."""
 
     def __init__(self):
         """Initialize MCP configuration with default values."""
-        self._config = {
-            "server": {
-                "url": "ws://localhost:8080",
-                "timeout": 30000,
-                "retry_attempts": 3,
-                "retry_delay": 1000
-            },
-            "bridge": {
-                "extension_mode": False,
-                "extension_port": 9222
-            },
-            "bridge_extension": {
-                "extension_id": None,
-                "websocket_url": "ws://localhost:9222",
-                "connection_timeout": 30000,
-                "retry_attempts": 3,
-                "retry_delay": 1000,
-                "auth_token": None
-            }
-        }
+        # Section values are scalars, so a shallow copy per section is enough
+        self._config = {section: dict(values) for section, values in _DEFAULT_CONFIG.items()}
 
     def get_server_url(self) -> str:
         """Get the MCP server URL."""
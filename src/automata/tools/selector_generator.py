@@ -2,16 +2,173 @@
 Selector generator tool that converts HTML to robust selectors.
 """
 
+import copy
 import os
 import re
+import stat
 import sys
-from typing import Dict, Any, Optional, List, Union, Tuple
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional, List, Union, Tuple
 from lxml import html, etree
 from ..core.errors import AutomationError, XPathError, XPathSyntaxError, XPathEvaluationError, XPathUnsupportedFeatureError
 from ..core.logger import get_logger
 
+try:
+    from lxml.cssselect import CSSSelector
+except ImportError:  # pragma: no cover - cssselect is optional
+    CSSSelector = None
+
 logger = get_logger(__name__)
 
+# Bounded caches for fragment wrapping and parsing; entries are evicted by size only
+_WRAP_CACHE_SIZE = 256
+_PARSE_CACHE_SIZE = 256
+# Larger fragments and documents are processed on every call rather than pinned in a cache
+_CACHE_MAX_CONTENT = 64 * 1024
+_PARSE_CACHE: "OrderedDict[str, html.HtmlElement]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Shared parser for fragment processing; collect_ids=False skips libxml2's per-parse ID table
+_HTML_PARSER = html.HTMLParser(collect_ids=False)
+
+# Fixed scaffolding placed around fragments by wrap_html_fragment
+_WRAPPER_PREFIX = """<!DOCTYPE html>
+<html>
+<head>
+    <title>HTML Fragment</title>
+</head>
+<body>
+"""
+_WRAPPER_SUFFIX = """
+</body>
+</html>"""
+
+# Markers of a complete document: a leading DOCTYPE, or an html/body tag near the start.
+# Case-insensitive patterns replace lower() plus substring scans
+_DOCTYPE_PREFIX = re.compile(r'\s*<!doctype', re.IGNORECASE)
+_LEADING_WHITESPACE = re.compile(r'\s*')
+_FRAGMENT_SENTINEL = re.compile(r'<\s*(?:html|body)\b', re.IGNORECASE)
+# Real documents declare these within the first few KiB, so only that prefix is scanned
+_FRAGMENT_SENTINEL_WINDOW = 4096
+# Longest span checked for a marker tag that straddles the end of the window
+_FRAGMENT_SENTINEL_STRADDLE = 64
+_SELECTOR_CACHE_SIZE = 512
+# Auto-detection XPaths, keyed on the generator's important tags and test attributes
+_IMPORTANT_XPATH_CACHE_SIZE = 16
+# Document scaffolding that _get_all_elements leaves out of "all" targeting
+_WRAPPER_TAGS = frozenset(("html", "body"))
+# Ancestors at which generated XPaths stop
+_XPATH_STOP_TAGS = frozenset(("body", "html"))
+# Bare tag-name selectors ("button", "//button") are served by a direct tree walk
+_TAG_ONLY_CSS = re.compile(r'[a-zA-Z][a-zA-Z0-9]*')
+_TAG_ONLY_XPATH = re.compile(r'//([a-zA-Z][a-zA-Z0-9]*)')
+_RESULT_CACHE_SIZE = 128
+_RESULT_CACHE_MAX_FRAGMENT = 64 * 1024
+_STDIN_CHUNK_SIZE = 1 << 20
+_FILE_CHUNK_SIZE = 64 * 1024
+_MAX_STDIN_BYTES = 64 * 1024 * 1024
+
+
+def _parse_and_cache(html_content: str) -> html.HtmlElement:
+    """Parse HTML content and keep the tree for a later _parse_html of the same input.
+
+    The cached tree is shared and must not be mutated. Parse errors propagate and are never
+    cached; content above _CACHE_MAX_CONTENT is parsed without being cached.
+    """
+    parsed = html.fromstring(html_content, parser=_HTML_PARSER)
+    if len(html_content) <= _CACHE_MAX_CONTENT:
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[html_content] = parsed
+            _PARSE_CACHE.move_to_end(html_content)
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+    return parsed
+
+
+def _parse_html(html_content: str) -> html.HtmlElement:
+    """Return a private tree for html_content.
+
+    A tree cached by _parse_and_cache is copied, which costs about a third of a parse;
+    anything else is parsed once and not cached, so a cache miss is a single parse.
+    """
+    if len(html_content) <= _CACHE_MAX_CONTENT:
+        with _PARSE_CACHE_LOCK:
+            cached = _PARSE_CACHE.get(html_content)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(html_content)
+        if cached is not None:
+            return copy.deepcopy(cached)
+    return html.fromstring(html_content, parser=_HTML_PARSER)
+
+
+def _decode_text(data: bytes, encoding: str = "utf-8") -> str:
+    """Decode raw bytes strictly and normalize newlines as a text-mode read would."""
+    return data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_stdin() -> str:
+    """Read all of stdin in bounded chunks from its file descriptor and decode once.
+
+    Falls back to sys.stdin.read() when stdin has no real descriptor (e.g. a replaced stream).
+    """
+    try:
+        fd = sys.stdin.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    if not isinstance(fd, int):
+        return sys.stdin.read()
+
+    buffer = bytearray()
+    while True:
+        chunk = os.read(fd, _STDIN_CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+        if len(buffer) > _MAX_STDIN_BYTES:
+            raise AutomationError(f"HTML fragment on stdin exceeds {_MAX_STDIN_BYTES} bytes")
+    return _decode_text(buffer, getattr(sys.stdin, "encoding", None) or "utf-8")
+
+
+@lru_cache(maxsize=_SELECTOR_CACHE_SIZE)
+def _compile_selector(selector: str, selector_type: str):
+    """Compile a CSS or XPath selector once; invalid selectors raise and are not cached."""
+    if selector_type == "css":
+        if CSSSelector is None:
+            raise ImportError("cssselect does not seem to be installed")
+        return CSSSelector(selector, translator="html")
+    return etree.XPath(selector)
+
+
+@lru_cache(maxsize=_IMPORTANT_XPATH_CACHE_SIZE)
+def _compile_important_xpath(tags: Tuple[str, ...], test_attributes: Tuple[str, ...]) -> etree.XPath:
+    """Compile a single union of the tag and attribute checks used by auto-detection."""
+    predicates = [f"self::{tag}" for tag in tags]
+    predicates += [f"@{attr}" for attr in ("id",) + test_attributes]
+    return etree.XPath(f"//*[{' or '.join(predicates)}]")
+
+
+def _wrap_fragment(fragment: str) -> str:
+    """Wrap an already stripped, non-empty fragment in a basic HTML document."""
+    # Basic validation - check if it contains at least one HTML tag
+    if not re.search(r'<[^>]+>', fragment):
+        raise AutomationError("HTML fragment does not contain any valid HTML tags")
+
+    wrapped_html = "".join((_WRAPPER_PREFIX, fragment, _WRAPPER_SUFFIX))
+
+    # Validate the wrapped HTML by parsing it; the tree is kept for generate_from_fragment
+    try:
+        _parse_and_cache(wrapped_html)
+    except Exception as parse_error:
+        raise AutomationError(f"Wrapped HTML is invalid: {parse_error}")
+
+    return wrapped_html
+
+
+# Only fragments up to _CACHE_MAX_CONTENT go through the cached variant
+_wrap_fragment_cached = lru_cache(maxsize=_WRAP_CACHE_SIZE)(_wrap_fragment)
+
 
 class SelectorGenerator:
     """Generates robust selectors from HTML elements."""
@@ -26,6 +183,10 @@ class SelectorGenerator:
             "button", "input", "a", "select", "textarea", "form",
             "img", "table", "tr", "td", "th", "ul", "ol", "li"
         ]
+        self.test_attributes = ["data-testid", "data-test", "data-cy", "data-qa"]
+        # generate_from_fragment results keyed on (fragment, mode, selector, selector type,
+        # attribute configuration)
+        self._result_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
 
     def generate_selectors(self, html_content: str, element_info: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -118,7 +279,7 @@ class SelectorGenerator:
                 current = current.getparent()
                 
                 # Stop at body or html
-                if current is not None and current.tag in ["body", "html"]:
+                if current is not None and current.tag in _XPATH_STOP_TAGS:
                     break
             
             # Join path segments
@@ -615,17 +776,10 @@ class SelectorGenerator:
             id_elements = parsed_html.xpath("//*[@id]")
             important_elements.extend(id_elements)
             
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_elements = []
-            for element in important_elements:
-                if element not in seen:
-                    seen.add(element)
-                    unique_elements.append(element)
-            
-            # Generate selectors for each important element
+            # Generate selectors for each important element (dict.fromkeys drops
+            # duplicates and keeps first-seen order, which decides which selectors win)
             all_selectors = {}
-            for element in unique_elements:
+            for element in dict.fromkeys(important_elements):
                 element_selectors = {
                     "xpath": self._generate_xpath(element),
                     "css": self._generate_css_selector(element),
@@ -690,22 +844,29 @@ class SelectorGenerator:
             if not html_content or not html_content.strip():
                 raise AutomationError("HTML content is empty")
             
-            # Normalize whitespace and convert to lowercase for checking
-            normalized = html_content.strip().lower()
-            
-            # Check if it has DOCTYPE
-            if normalized.startswith('<!doctype'):
+            # A document starting with DOCTYPE (after optional whitespace) is complete
+            if _DOCTYPE_PREFIX.match(html_content):
                 return False
             
-            # Check if it has html tag
-            if '<html' in normalized[:1000]:  # Check first 1000 chars for efficiency
-                return False
+            # Scan the window that follows any leading whitespace, without copying the string
+            start = _LEADING_WHITESPACE.match(html_content).end()
+            end = start + _FRAGMENT_SENTINEL_WINDOW
             
-            # Check if it has body tag
-            if '<body' in normalized[:1000]:  # Check first 1000 chars for efficiency
+            # An html or body tag near the start marks a complete document
+            if _FRAGMENT_SENTINEL.search(html_content, start, end):
                 return False
             
-            # If none of the above, it's likely a fragment
+            # When a tag is cut off at the window boundary, check only that tag
+            last_open = html_content.rfind("<", start, end)
+            if (
+                len(html_content) > end
+                and last_open != -1
+                and html_content.find(">", last_open, end) == -1
+            ):
+                return _FRAGMENT_SENTINEL.match(
+                    html_content, last_open, last_open + _FRAGMENT_SENTINEL_STRADDLE
+                ) is None
+            
             return True
         
         except AutomationError:
@@ -734,31 +895,11 @@ class SelectorGenerator:
             if not html_fragment or not html_fragment.strip():
                 raise AutomationError("HTML fragment is empty")
             
-            # Strip leading/trailing whitespace from the fragment
+            # Strip leading/trailing whitespace and wrap (cached per stripped fragment)
             fragment = html_fragment.strip()
-            
-            # Basic validation - check if it contains at least one HTML tag
-            if not re.search(r'<[^>]+>', fragment):
-                raise AutomationError("HTML fragment does not contain any valid HTML tags")
-            
-            # Create the wrapper HTML
-            wrapped_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>HTML Fragment</title>
-</head>
-<body>
-{fragment}
-</body>
-</html>"""
-            
-            # Validate the wrapped HTML by trying to parse it
-            try:
-                html.fromstring(wrapped_html)
-            except Exception as parse_error:
-                raise AutomationError(f"Wrapped HTML is invalid: {parse_error}")
-            
-            return wrapped_html
+            if len(fragment) > _CACHE_MAX_CONTENT:
+                return _wrap_fragment(fragment)
+            return _wrap_fragment_cached(fragment)
         
         except AutomationError:
             # Re-raise AutomationError as-is
@@ -791,6 +932,22 @@ class SelectorGenerator:
         """
         logger.info(f"Generating selectors from HTML fragment with targeting mode: {targeting_mode}")
         
+        cache_key = None
+        if isinstance(html_fragment, str) and len(html_fragment) <= _RESULT_CACHE_MAX_FRAGMENT:
+            cache_key = (
+                html_fragment,
+                targeting_mode,
+                custom_selector or "",
+                selector_type or "",
+                tuple(self.attribute_priority),
+                tuple(self.important_elements),
+                tuple(self.test_attributes),
+            )
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+        
         try:
             # Validate targeting mode
             if targeting_mode not in ["all", "selector", "auto"]:
@@ -812,9 +969,9 @@ class SelectorGenerator:
             else:
                 html_content = html_fragment
             
-            # Parse HTML
+            # Parse HTML (a private copy of the cached tree, so callers may mutate it)
             try:
-                parsed_html = html.fromstring(html_content)
+                parsed_html = _parse_html(html_content)
             except Exception as parse_error:
                 raise AutomationError(f"Failed to parse HTML content: {parse_error}")
             
@@ -843,25 +1000,14 @@ class SelectorGenerator:
                 return {}
             
             # Generate selectors for each target element
-            results = {}
-            for i, element in enumerate(target_elements):
-                # Create element info for this element
-                element_info = {}
-                
-                # Try to generate a unique identifier for this element
-                element_id = f"element_{i}"
-                
-                # Generate selectors for this element
-                selectors = self._generate_selectors_for_element(element, html_content)
-                
-                if selectors:
-                    results[element_id] = {
-                        "selectors": selectors,
-                        "element_tag": element.tag,
-                        "element_text": element.text_content().strip()[:50] if element.text_content() else ""
-                    }
+            results = dict(self._iter_results(target_elements, html_content))
             
             logger.info(f"Generated selectors for {len(results)} elements from HTML fragment")
+            
+            if cache_key is not None:
+                self._result_cache[cache_key] = copy.deepcopy(results)
+                if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
             return results
         
         except AutomationError:
@@ -903,6 +1049,55 @@ class SelectorGenerator:
             logger.warning(f"Error generating selectors for element: {e}")
             return {}
 
+    def _iter_results(
+        self,
+        elements: List[html.HtmlElement],
+        html_content: str
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Lazily yield result entries for the given elements.
+
+        Args:
+            elements: Target HTML elements
+            html_content: Full HTML content
+
+        Yields:
+            Tuples of ("element_<index>", element record); elements without selectors are skipped
+        """
+        for i, element in enumerate(elements):
+            record = self._describe_element(element, html_content)
+            if record is not None:
+                yield f"element_{i}", record
+
+    def _describe_element(
+        self,
+        element: html.HtmlElement,
+        html_content: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the result record for a single element.
+
+        Records stay plain dicts so results remain directly JSON-serializable
+        (save_selectors and the CLI dump them with json).
+
+        Args:
+            element: HTML element to describe
+            html_content: Full HTML content
+
+        Returns:
+            Record with selectors, element_tag and element_text, or None if no selectors were generated
+        """
+        selectors = self._generate_selectors_for_element(element, html_content)
+        if not selectors:
+            return None
+        
+        text = element.text_content()
+        return {
+            "selectors": selectors,
+            "element_tag": element.tag,
+            "element_text": text.strip()[:50] if text else ""
+        }
+
     def _get_all_elements(self, parsed_html: html.HtmlElement) -> List[html.HtmlElement]:
         """
         Get all elements from the parsed HTML.
@@ -914,13 +1109,12 @@ class SelectorGenerator:
             List of all HTML elements
         """
         try:
-            # Use XPath to get all elements
-            all_elements = parsed_html.xpath("//*")
+            # Walk every element of the document, as //* did, without building an XPath result;
+            # the etree.Element filter skips comments and processing instructions
+            all_elements = parsed_html.getroottree().iter(etree.Element)
             
             # Filter out the html and body elements as they're part of our wrapper
-            filtered_elements = [el for el in all_elements if el.tag not in ["html", "body"]]
-            
-            return filtered_elements
+            return [el for el in all_elements if el.tag not in _WRAPPER_TAGS]
         
         except Exception as e:
             logger.warning(f"Error getting all elements: {e}")
@@ -951,15 +1145,22 @@ class SelectorGenerator:
                 raise AutomationError("Selector cannot be empty")
             
             elements = []
-            
-            if selector_type == "css":
+            xpath_tag = _TAG_ONLY_XPATH.fullmatch(selector) if selector_type == "xpath" else None
+            
+            if selector_type == "css" and _TAG_ONLY_CSS.fullmatch(selector):
+                # Descendant-or-self match, like cssselect; HTML tag names are case-insensitive
+                elements = list(parsed_html.iter(selector.lower()))
+            elif xpath_tag:
+                # Absolute //tag search covers the whole document, not just this subtree
+                elements = list(parsed_html.getroottree().iter(xpath_tag.group(1)))
+            elif selector_type == "css":
                 try:
-                    elements = parsed_html.cssselect(selector)
+                    elements = _compile_selector(selector, selector_type)(parsed_html)
                 except Exception as css_error:
                     raise AutomationError(f"Invalid CSS selector '{selector}': {css_error}")
             elif selector_type == "xpath":
                 try:
-                    elements = parsed_html.xpath(selector)
+                    elements = _compile_selector(selector, selector_type)(parsed_html)
                 except Exception as xpath_error:
                     raise AutomationError(f"Invalid XPath selector '{selector}': {xpath_error}")
             else:
@@ -985,31 +1186,12 @@ class SelectorGenerator:
             List of important HTML elements
         """
         try:
-            important_elements = []
-            
-            # Find elements with important tags
-            for tag in self.important_elements:
-                elements = parsed_html.xpath(f"//{tag}")
-                important_elements.extend(elements)
-            
-            # Find elements with IDs
-            id_elements = parsed_html.xpath("//*[@id]")
-            important_elements.extend(id_elements)
-            
-            # Find elements with test attributes
-            for attr in ["data-testid", "data-test", "data-cy", "data-qa"]:
-                elements = parsed_html.xpath(f"//*[@{attr}]")
-                important_elements.extend(elements)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_elements = []
-            for element in important_elements:
-                if element not in seen:
-                    seen.add(element)
-                    unique_elements.append(element)
-            
-            return unique_elements
+            # One traversal matching important tags, IDs and test attributes; the
+            # result is in document order and already free of duplicates
+            important_xpath = _compile_important_xpath(
+                tuple(self.important_elements), tuple(self.test_attributes)
+            )
+            return important_xpath(parsed_html)
         
         except Exception as e:
             logger.warning(f"Error auto-detecting important elements: {e}")
@@ -1040,18 +1222,31 @@ class SelectorGenerator:
         logger.info(f"Generating selectors from HTML fragment file: {file_path}")
         
         try:
-            # Check if file exists
-            if not os.path.exists(file_path):
+            # One stat answers existence, file type and size
+            try:
+                file_stat = os.stat(file_path)
+            except (OSError, ValueError):
                 raise AutomationError(f"File not found: {file_path}")
             
             # Check if it's a file (not a directory)
-            if not os.path.isfile(file_path):
+            if not stat.S_ISREG(file_stat.st_mode):
                 raise AutomationError(f"Path is not a file: {file_path}")
             
-            # Read HTML fragment file
+            # Read HTML fragment file as raw bytes sized from the stat and decode once.
+            # Pseudo-files (e.g. under /proc) report a size of 0, so read those in chunks
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    html_fragment = f.read()
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    chunks = []
+                    size = file_stat.st_size or _FILE_CHUNK_SIZE
+                    while True:
+                        chunk = os.read(fd, size)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                finally:
+                    os.close(fd)
+                html_fragment = _decode_text(b"".join(chunks))
             except Exception as file_error:
                 raise AutomationError(f"Error reading file {file_path}: {file_error}")
             
@@ -1099,7 +1294,7 @@ class SelectorGenerator:
                 # No input from stdin
                 raise AutomationError("No HTML fragment provided via stdin")
             
-            html_fragment = sys.stdin.read()
+            html_fragment = _read_stdin()
             
             if not html_fragment.strip():
                 raise AutomationError("Empty HTML fragment provided via stdin")
@@ -12,6 +12,9 @@ from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Matches ${variable} or $variable placeholders
+_VARIABLE_PATTERN = re.compile(r'\$\{?([a-zA-Z_][a-zA-Z0-9_]*)\}?')
+
 
 class VariableManager:
     """Manages variables for storing and using dynamic values."""
@@ -190,9 +193,6 @@ class VariableManager:
             # DEBUG: Log the substitution attempt
             logger.debug(f"VARIABLE_SUBSTITUTION: Attempting to substitute variables in text: '{text}'")
             
-            # Match ${variable} or $variable patterns
-            pattern = r'\$\{?([a-zA-Z_][a-zA-Z0-9_]*)\}?'
-            
             def replace_match(match):
                 var_name = match.group(1)
                 # DEBUG: Log each variable lookup
@@ -203,7 +203,7 @@ class VariableManager:
                 return str(var_value)
             
             # Replace all matches
-            result = re.sub(pattern, replace_match, text)
+            result = _VARIABLE_PATTERN.sub(replace_match, text)
             
             # DEBUG: Log the final result
             logger.debug(f"VARIABLE_SUBSTITUTION: Final result: '{result}'")
@@ -593,9 +593,12 @@ class VariableManager:
             Dictionary of variable names and values
         """
         try:
-            result = {}
-            for name in names:
-                result[name] = self.get_variable(name)
+            # In-memory hits are read directly; only misses go through get_variable's disk fallback
+            variables = self.variables
+            result = {
+                name: variables[name] if name in variables else self.get_variable(name)
+                for name in names
+            }
             
             logger.debug(f"Bulk get {len(names)} variables")
             return result
@@ -2,7 +2,6 @@
 Pytest configuration and shared fixtures.
 """
 
-import asyncio
 import json
 import os
 import tempfile
@@ -27,14 +26,6 @@ from src.automata.tools.action_builder import ActionBuilder
 from src.automata.utils.file_io import FileIO
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(scope="session")
 async def browser():
     """Launch a browser for testing."""
@@ -208,7 +199,7 @@ def sample_workflow():
 
 
 @pytest.fixture
-def sample_html_file():
+def sample_html_file(tmp_path):
     """Create a sample HTML file for testing."""
     html_content = """
     <!DOCTYPE html>
@@ -238,17 +229,17 @@ def sample_html_file():
     </html>
     """
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-        f.write(html_content)
-        return f.name
+    path = tmp_path / "sample.html"
+    path.write_text(html_content)
+    return str(path)
 
 
 @pytest.fixture
-def sample_workflow_file(sample_workflow):
+def sample_workflow_file(sample_workflow, tmp_path):
     """Create a sample workflow file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(sample_workflow, f, indent=2)
-        return f.name
+    path = tmp_path / "sample_workflow.json"
+    path.write_text(json.dumps(sample_workflow))
+    return str(path)
 
 
 @pytest.fixture
@@ -2,6 +2,8 @@
 Fixtures for MCP bridge tests.
 """
 
+import os
+
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,6 +14,17 @@ from src.automata.mcp.bridge import MCPBridgeConnector
 from src.automata.core.mcp_bridge import MCPBridgeConnector as CoreMCPBridgeConnector
 
 
+@pytest.fixture(autouse=True)
+def _env_snapshot():
+    """Restore os.environ after each test so tests can mutate it directly."""
+    snapshot = os.environ.copy()
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(snapshot)
+
+
 @pytest.fixture
 def mcp_config():
     """Create a basic MCP bridge config for testing."""
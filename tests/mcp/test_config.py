@@ -4,12 +4,21 @@ Unit tests for MCP configuration.
 
 import json
 import os
-import tempfile
+import re
 import pytest
-from unittest.mock import patch, mock_open, MagicMock
 
 from automata.mcp.config import MCPConfiguration
 
+# Compiled once so pytest.raises(match=...) does not recompile per test
+_MATCH_SERVER_URL = re.compile("MCP server URL must be a non-empty string")
+_MATCH_TIMEOUT = re.compile("MCP timeout must be a positive integer")
+_MATCH_RETRY_ATTEMPTS = re.compile("MCP retry attempts must be a non-negative integer")
+_MATCH_RETRY_DELAY = re.compile("MCP retry delay must be a non-negative integer")
+_MATCH_BRIDGE_PORT = re.compile("MCP bridge extension port must be a valid port number")
+_MATCH_SESSION_SYNC = re.compile("MCP session sync_enabled must be a boolean")
+_MATCH_PREFER_MCP = re.compile("MCP authentication prefer_mcp must be a boolean")
+_MATCH_FALLBACK = re.compile("MCP authentication fallback_to_automata must be a boolean")
+
 
 class TestMCPConfiguration:
     """Test cases for MCPConfiguration class."""
@@ -29,7 +38,7 @@ class TestMCPConfiguration:
         assert config.prefer_mcp_authentication() is False
         assert config.fallback_to_automata_authentication() is True
 
-    def test_config_from_file(self):
+    def test_config_from_file(self, tmp_path):
         """Test that configuration is loaded from file correctly."""
         file_config = {
             "mcp": {
@@ -52,29 +61,25 @@ class TestMCPConfiguration:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(file_config, f)
-            temp_path = f.name
-
-        try:
-            config = MCPConfiguration(config_path=temp_path)
-
-            assert config.get_server_url() == "http://example.com:9000"
-            assert config.get_timeout() == 60000
-            assert config.get_retry_attempts() == 5
-            assert config.get_retry_delay() == 2000
-            assert config.is_bridge_extension_enabled() is False
-            assert config.get_bridge_extension_port() == 9333
-            assert config.is_session_sync_enabled() is False
-            assert config.get_session_encryption_key() == "test-key"
-            assert config.prefer_mcp_authentication() is True
-            assert config.fallback_to_automata_authentication() is False
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(file_config), encoding="utf-8")
+
+        config = MCPConfiguration(config_path=str(temp_path))
+
+        assert config.get_server_url() == "http://example.com:9000"
+        assert config.get_timeout() == 60000
+        assert config.get_retry_attempts() == 5
+        assert config.get_retry_delay() == 2000
+        assert config.is_bridge_extension_enabled() is False
+        assert config.get_bridge_extension_port() == 9333
+        assert config.is_session_sync_enabled() is False
+        assert config.get_session_encryption_key() == "test-key"
+        assert config.prefer_mcp_authentication() is True
+        assert config.fallback_to_automata_authentication() is False
 
     def test_config_from_environment(self):
         """Test that configuration is loaded from environment variables correctly."""
-        with patch.dict(os.environ, {
+        os.environ.update({
             "MCP_SERVER_URL": "http://env-example.com:8000",
             "MCP_TIMEOUT": "45000",
             "MCP_RETRY_ATTEMPTS": "4",
@@ -83,22 +88,22 @@ class TestMCPConfiguration:
             "MCP_SESSION_ENCRYPTION_KEY": "env-key",
             "MCP_PREFER_MCP_AUTH": "true",
             "MCP_FALLBACK_TO_AUTOMATA_AUTH": "false"
-        }):
-            config = MCPConfiguration()
-
-            assert config.get_server_url() == "http://env-example.com:8000"
-            assert config.get_timeout() == 45000
-            assert config.get_retry_attempts() == 4
-            assert config.get_retry_delay() == 1500
-            assert config.get_bridge_extension_port() == 9444
-            assert config.get_session_encryption_key() == "env-key"
-            assert config.prefer_mcp_authentication() is True
-            assert config.fallback_to_automata_authentication() is False
+        })
+        config = MCPConfiguration()
+
+        assert config.get_server_url() == "http://env-example.com:8000"
+        assert config.get_timeout() == 45000
+        assert config.get_retry_attempts() == 4
+        assert config.get_retry_delay() == 1500
+        assert config.get_bridge_extension_port() == 9444
+        assert config.get_session_encryption_key() == "env-key"
+        assert config.prefer_mcp_authentication() is True
+        assert config.fallback_to_automata_authentication() is False
 
     def test_config_validation_invalid_server_url(self):
         """Test that invalid server URL raises ValueError."""
         config = MCPConfiguration()
-        with pytest.raises(ValueError, match="MCP server URL must be a non-empty string"):
+        with pytest.raises(ValueError, match=_MATCH_SERVER_URL):
             config._validate_config({
                 "mcp": {
                     "server_url": None,
@@ -106,7 +111,7 @@ class TestMCPConfiguration:
                 }
             })
 
-    def test_config_validation_empty_server_url(self):
+    def test_config_validation_empty_server_url(self, tmp_path):
         """Test that empty server URL raises ValueError."""
         # Create a temporary file with invalid configuration
         invalid_config = {
@@ -118,17 +123,13 @@ class TestMCPConfiguration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="MCP server URL must be a non-empty string"):
-                MCPConfiguration(config_path=temp_path)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(invalid_config), encoding="utf-8")
 
-    def test_config_validation_invalid_timeout(self):
+        with pytest.raises(ValueError, match=_MATCH_SERVER_URL):
+            MCPConfiguration(config_path=str(temp_path))
+
+    def test_config_validation_invalid_timeout(self, tmp_path):
         """Test that invalid timeout raises ValueError."""
         # Create a temporary file with invalid configuration
         invalid_config = {
@@ -140,17 +141,13 @@ class TestMCPConfiguration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="MCP timeout must be a positive integer"):
-                MCPConfiguration(config_path=temp_path)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(invalid_config), encoding="utf-8")
 
-    def test_config_validation_invalid_retry_attempts(self):
+        with pytest.raises(ValueError, match=_MATCH_TIMEOUT):
+            MCPConfiguration(config_path=str(temp_path))
+
+    def test_config_validation_invalid_retry_attempts(self, tmp_path):
         """Test that invalid retry attempts raises ValueError."""
         # Create a temporary file with invalid configuration
         invalid_config = {
@@ -162,17 +159,13 @@ class TestMCPConfiguration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="MCP retry attempts must be a non-negative integer"):
-                MCPConfiguration(config_path=temp_path)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(invalid_config), encoding="utf-8")
 
-    def test_config_validation_invalid_retry_delay(self):
+        with pytest.raises(ValueError, match=_MATCH_RETRY_ATTEMPTS):
+            MCPConfiguration(config_path=str(temp_path))
+
+    def test_config_validation_invalid_retry_delay(self, tmp_path):
         """Test that invalid retry delay raises ValueError."""
         # Create a temporary file with invalid configuration
         invalid_config = {
@@ -184,17 +177,13 @@ class TestMCPConfiguration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="MCP retry delay must be a non-negative integer"):
-                MCPConfiguration(config_path=temp_path)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(invalid_config), encoding="utf-8")
 
-    def test_config_validation_invalid_bridge_port(self):
+        with pytest.raises(ValueError, match=_MATCH_RETRY_DELAY):
+            MCPConfiguration(config_path=str(temp_path))
+
+    def test_config_validation_invalid_bridge_port(self, tmp_path):
         """Test that invalid bridge extension port raises ValueError."""
         # Create a temporary file with invalid configuration
         invalid_config = {
@@ -209,17 +198,13 @@ class TestMCPConfiguration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="MCP bridge extension port must be a valid port number"):
-                MCPConfiguration(config_path=temp_path)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(invalid_config), encoding="utf-8")
 
-    def test_config_validation_invalid_bridge_port_too_high(self):
+        with pytest.raises(ValueError, match=_MATCH_BRIDGE_PORT):
+            MCPConfiguration(config_path=str(temp_path))
+
+    def test_config_validation_invalid_bridge_port_too_high(self, tmp_path):
         """Test that too high bridge extension port raises ValueError."""
         # Create a temporary file with invalid configuration
         invalid_config = {
@@ -234,17 +219,13 @@ class TestMCPConfiguration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="MCP bridge extension port must be a valid port number"):
-                MCPConfiguration(config_path=temp_path)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(invalid_config), encoding="utf-8")
 
-    def test_config_validation_invalid_session_sync(self):
+        with pytest.raises(ValueError, match=_MATCH_BRIDGE_PORT):
+            MCPConfiguration(config_path=str(temp_path))
+
+    def test_config_validation_invalid_session_sync(self, tmp_path):
         """Test that invalid session sync setting raises ValueError."""
         # Create a temporary file with invalid configuration
         invalid_config = {
@@ -259,17 +240,13 @@ class TestMCPConfiguration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="MCP session sync_enabled must be a boolean"):
-                MCPConfiguration(config_path=temp_path)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(invalid_config), encoding="utf-8")
 
-    def test_config_validation_invalid_prefer_mcp(self):
+        with pytest.raises(ValueError, match=_MATCH_SESSION_SYNC):
+            MCPConfiguration(config_path=str(temp_path))
+
+    def test_config_validation_invalid_prefer_mcp(self, tmp_path):
         """Test that invalid prefer_mcp setting raises ValueError."""
         # Create a temporary file with invalid configuration
         invalid_config = {
@@ -284,17 +261,13 @@ class TestMCPConfiguration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="MCP authentication prefer_mcp must be a boolean"):
-                MCPConfiguration(config_path=temp_path)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(invalid_config), encoding="utf-8")
 
-    def test_config_validation_invalid_fallback(self):
+        with pytest.raises(ValueError, match=_MATCH_PREFER_MCP):
+            MCPConfiguration(config_path=str(temp_path))
+
+    def test_config_validation_invalid_fallback(self, tmp_path):
         """Test that invalid fallback setting raises ValueError."""
         # Create a temporary file with invalid configuration
         invalid_config = {
@@ -309,33 +282,23 @@ class TestMCPConfiguration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            json.dump(invalid_config, f)
-            temp_path = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="MCP authentication fallback_to_automata must be a boolean"):
-                MCPConfiguration(config_path=temp_path)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "mcp_config.json"
+        temp_path.write_text(json.dumps(invalid_config), encoding="utf-8")
 
-    def test_save_config(self):
+        with pytest.raises(ValueError, match=_MATCH_FALLBACK):
+            MCPConfiguration(config_path=str(temp_path))
+
+    def test_save_config(self, tmp_path):
         """Test that configuration is saved correctly."""
         config = MCPConfiguration()
+        temp_path = tmp_path / "mcp_config.json"
 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            config.save_config(temp_path)
+        config.save_config(str(temp_path))
 
-            with open(temp_path, "r") as f:
-                saved_config = json.load(f)
+        saved_config = json.loads(temp_path.read_bytes())
 
-            assert saved_config["mcp"]["server_url"] == "http://localhost:8080"
-            assert saved_config["mcp"]["timeout"] == 30000
-        finally:
-            os.unlink(temp_path)
+        assert saved_config["mcp"]["server_url"] == "http://localhost:8080"
+        assert saved_config["mcp"]["timeout"] == 30000
 
     def test_get_config(self):
         """Test that get_config returns the full configuration."""
@@ -348,28 +311,28 @@ class TestMCPConfiguration:
 
     def test_invalid_environment_timeout(self):
         """Test that invalid timeout environment variable uses default."""
-        with patch.dict(os.environ, {"MCP_TIMEOUT": "not_a_number"}):
-            config = MCPConfiguration()
-            # Should use default value
-            assert config.get_timeout() == 30000
+        os.environ["MCP_TIMEOUT"] = "not_a_number"
+        config = MCPConfiguration()
+        # Should use default value
+        assert config.get_timeout() == 30000
 
     def test_invalid_environment_retry_attempts(self):
         """Test that invalid retry_attempts environment variable uses default."""
-        with patch.dict(os.environ, {"MCP_RETRY_ATTEMPTS": "not_a_number"}):
-            config = MCPConfiguration()
-            # Should use default value
-            assert config.get_retry_attempts() == 3
+        os.environ["MCP_RETRY_ATTEMPTS"] = "not_a_number"
+        config = MCPConfiguration()
+        # Should use default value
+        assert config.get_retry_attempts() == 3
 
     def test_invalid_environment_retry_delay(self):
         """Test that invalid retry_delay environment variable uses default."""
-        with patch.dict(os.environ, {"MCP_RETRY_DELAY": "not_a_number"}):
-            config = MCPConfiguration()
-            # Should use default value
-            assert config.get_retry_delay() == 1000
+        os.environ["MCP_RETRY_DELAY"] = "not_a_number"
+        config = MCPConfiguration()
+        # Should use default value
+        assert config.get_retry_delay() == 1000
 
     def test_invalid_environment_bridge_port(self):
         """Test that invalid bridge_port environment variable uses default."""
-        with patch.dict(os.environ, {"MCP_BRIDGE_PORT": "not_a_number"}):
-            config = MCPConfiguration()
-            # Should use default value
-            assert config.get_bridge_extension_port() == 9222
\ No newline at end of file
+        os.environ["MCP_BRIDGE_PORT"] = "not_a_number"
+        config = MCPConfiguration()
+        # Should use default value
+        assert config.get_bridge_extension_port() == 9222
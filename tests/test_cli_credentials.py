@@ -4,188 +4,200 @@ Tests for the CLI credentials parameter.
 
 import json
 import os
-import tempfile
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
 from click.testing import CliRunner
 
+import src.automata.auth.config as auth_config_module
+import src.automata.cli.main as cli_main_module
+from src.automata.auth.config import AuthenticationConfig
 from src.automata.cli.main import cli
+from src.automata.workflow.builder import WorkflowBuilder
+from src.automata.workflow.engine import WorkflowExecutionEngine
 
+# Patch targets shared by every test, as (module, attribute) pairs for patch.object
+_AUTH_CONFIG_TARGET = (auth_config_module, "AuthenticationConfig")
+_ENGINE_TARGET = (cli_main_module, "WorkflowExecutionEngine")
+_BUILDER_TARGET = (cli_main_module, "WorkflowBuilder")
 
-@pytest.fixture
-def valid_credentials_file():
-    """Create a valid credentials file for testing."""
-    credentials_data = {
-        "credentials": {
-            "username": "testuser",
-            "password": "testpass123",
-            "email": "testuser@example.com"
-        },
-        "config": {
-            "base_url": "https://api.example.com",
-            "timeout": 30
-        },
-        "custom_fields": {
-            "user_id": "12345",
-            "preferences": {
-                "theme": "dark"
-            }
+
+# Shared read-only test data; fixtures reference these instead of rebuilding them
+_CREDENTIALS_DATA = {
+    "credentials": {
+        "username": "testuser",
+        "password": "testpass123",
+        "email": "testuser@example.com"
+    },
+    "config": {
+        "base_url": "https://api.example.com",
+        "timeout": 30
+    },
+    "custom_fields": {
+        "user_id": "12345",
+        "preferences": {
+            "theme": "dark"
         }
     }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(credentials_data, f, indent=2)
-        return f.name
+}
 
+_MINIMAL_CREDENTIALS_DATA = {
+    "credentials": {
+        "username": "testuser",
+        "password": "testpass123"
+    },
+    "config": {}
+}
 
-@pytest.fixture
-def minimal_credentials_file():
-    """Create a minimal credentials file for testing."""
-    credentials_data = {
-        "credentials": {
-            "username": "testuser",
-            "password": "testpass123"
+_WORKFLOW_DATA = {
+    "name": "Test Workflow",
+    "version": "1.0.0",
+    "description": "A test workflow",
+    "variables": {
+        "url": "https://example.com",
+        "username": "${username}",
+        "password": "${password}"
+    },
+    "steps": [
+        {
+            "name": "Navigate to page",
+            "action": "navigate",
+            "value": "${url}"
         },
-        "config": {}
-    }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(credentials_data, f, indent=2)
-        return f.name
+        {
+            "name": "Login",
+            "action": "type",
+            "selector": "#username",
+            "value": "${username}"
+        },
+        {
+            "name": "Enter password",
+            "action": "type",
+            "selector": "#password",
+            "value": "${password}"
+        },
+        {
+            "name": "Submit",
+            "action": "click",
+            "selector": "#submit"
+        }
+    ]
+}
 
+_SESSION_RESPONSE = {
+    "success": True,
+    "session_data": _CREDENTIALS_DATA
+}
 
-@pytest.fixture
-def invalid_json_file():
-    """Create an invalid JSON file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        f.write('{"invalid": json}')
-        return f.name
+_STEPS_OK = [
+    {"status": "completed", "step_name": "Navigate to page"},
+    {"status": "completed", "step_name": "Login"},
+    {"status": "completed", "step_name": "Enter password"},
+    {"status": "completed", "step_name": "Submit"}
+]
 
+_STEPS_MIXED = [
+    {"status": "completed", "step_name": "Navigate to page"},
+    {"status": "failed", "step_name": "Login", "error": "Element not found"},
+    {"status": "skipped", "step_name": "Enter password"},
+    {"status": "skipped", "step_name": "Submit"}
+]
+
+# Encoded once at import so file fixtures only write bytes
+_CREDENTIALS_BYTES = json.dumps(_CREDENTIALS_DATA).encode()
+_MINIMAL_CREDENTIALS_BYTES = json.dumps(_MINIMAL_CREDENTIALS_DATA).encode()
+_WORKFLOW_BYTES = json.dumps(_WORKFLOW_DATA).encode()
+
+
+class _CoroutineStub:
+    """Plain async callable standing in for AsyncMock; records calls in .calls."""
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.side_effect = None
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+@pytest.fixture(scope="session")
+def fixture_dir(tmp_path_factory):
+    """Directory for the session's fixture files, managed by pytest's tmp_path_factory."""
+    return tmp_path_factory.mktemp("cred_fixtures")
+
+
+@pytest.fixture(scope="session")
+def valid_credentials_file(fixture_dir):
+    """Create a valid credentials file shared by the whole test session."""
+    path = fixture_dir / "valid.json"
+    path.write_bytes(_CREDENTIALS_BYTES)
+    return str(path)
 
-@pytest.fixture
-def sample_workflow_file():
-    """Create a sample workflow file for testing."""
-    workflow_data = {
-        "name": "Test Workflow",
-        "version": "1.0.0",
-        "description": "A test workflow",
-        "variables": {
-            "url": "https://example.com",
-            "username": "${username}",
-            "password": "${password}"
-        },
-        "steps": [
-            {
-                "name": "Navigate to page",
-                "action": "navigate",
-                "value": "${url}"
-            },
-            {
-                "name": "Login",
-                "action": "type",
-                "selector": "#username",
-                "value": "${username}"
-            },
-            {
-                "name": "Enter password",
-                "action": "type",
-                "selector": "#password",
-                "value": "${password}"
-            },
-            {
-                "name": "Submit",
-                "action": "click",
-                "selector": "#submit"
-            }
-        ]
-    }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(workflow_data, f, indent=2)
-        return f.name
+
+@pytest.fixture(scope="session")
+def minimal_credentials_file(fixture_dir):
+    """Create a minimal credentials file shared by the whole test session."""
+    path = fixture_dir / "minimal.json"
+    path.write_bytes(_MINIMAL_CREDENTIALS_BYTES)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def invalid_json_file(fixture_dir):
+    """Create an invalid JSON file shared by the whole test session."""
+    path = fixture_dir / "invalid.json"
+    path.write_text('{"invalid": json}')
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def sample_workflow_file(fixture_dir):
+    """Create a sample workflow file shared by the whole test session."""
+    path = fixture_dir / "workflow.json"
+    path.write_bytes(_WORKFLOW_BYTES)
+    return str(path)
 
 
 @pytest.fixture
 def mock_auth_config():
     """Create a mock authentication config."""
-    mock_config = MagicMock()
-    mock_config.authenticate = AsyncMock(return_value={
-        "success": True,
-        "session_data": {
-            "credentials": {
-                "username": "testuser",
-                "password": "testpass123",
-                "email": "testuser@example.com"
-            },
-            "config": {
-                "base_url": "https://api.example.com",
-                "timeout": 30
-            },
-            "custom_fields": {
-                "user_id": "12345",
-                "preferences": {
-                    "theme": "dark"
-                }
-            }
-        }
-    })
+    mock_config = MagicMock(spec=AuthenticationConfig)
+    mock_config.authenticate = AsyncMock(return_value=_SESSION_RESPONSE)
     return mock_config
 
 
 @pytest.fixture
-def mock_workflow_engine():
-    """Create a mock workflow execution engine."""
-    mock_engine = MagicMock()
+def cli_mocks(mock_auth_config):
+    """Create the auth config, workflow engine and workflow builder mocks in one place."""
+    mock_engine = MagicMock(spec=WorkflowExecutionEngine)
     mock_engine.variable_manager = MagicMock()
-    mock_engine.execute_workflow = AsyncMock(return_value=[
-        {"status": "completed", "step_name": "Navigate to page"},
-        {"status": "completed", "step_name": "Login"},
-        {"status": "completed", "step_name": "Enter password"},
-        {"status": "completed", "step_name": "Submit"}
-    ])
-    return mock_engine
+    mock_engine.execute_workflow = _CoroutineStub(return_value=_STEPS_OK)
+    mock_builder = MagicMock(spec=WorkflowBuilder)
+    mock_builder.load_workflow.return_value = _WORKFLOW_DATA
+    return SimpleNamespace(auth=mock_auth_config, engine=mock_engine, builder=mock_builder)
 
 
 @pytest.fixture
-def mock_workflow_builder():
-    """Create a mock workflow builder."""
-    mock_builder = MagicMock()
-    mock_builder.load_workflow.return_value = {
-        "name": "Test Workflow",
-        "version": "1.0.0",
-        "description": "A test workflow",
-        "variables": {
-            "url": "https://example.com",
-            "username": "${username}",
-            "password": "${password}"
-        },
-        "steps": [
-            {
-                "name": "Navigate to page",
-                "action": "navigate",
-                "value": "${url}"
-            },
-            {
-                "name": "Login",
-                "action": "type",
-                "selector": "#username",
-                "value": "${username}"
-            },
-            {
-                "name": "Enter password",
-                "action": "type",
-                "selector": "#password",
-                "value": "${password}"
-            },
-            {
-                "name": "Submit",
-                "action": "click",
-                "selector": "#submit"
-            }
-        ]
-    }
-    return mock_builder
+def patched_cli(cli_mocks):
+    """Patch the auth config, workflow engine and builder used by the CLI."""
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(*_AUTH_CONFIG_TARGET, return_value=cli_mocks.auth))
+        stack.enter_context(patch.object(*_ENGINE_TARGET, return_value=cli_mocks.engine))
+        stack.enter_context(patch.object(*_BUILDER_TARGET, return_value=cli_mocks.builder))
+        yield cli_mocks
+
+
+@pytest.fixture(scope="class")
+def runner():
+    """Create one CliRunner shared by every test in the class."""
+    # Click already routes stderr into result.output, which is all these tests read
+    return CliRunner()
 
 
 class TestCliCredentials:
@@ -194,80 +206,50 @@ class TestCliCredentials:
     @pytest.mark.unit
     @pytest.mark.cli
     @pytest.mark.auth
-    def test_workflow_execute_with_valid_credentials(self, valid_credentials_file, sample_workflow_file, 
-                                                   mock_auth_config, mock_workflow_engine, mock_workflow_builder):
+    def test_workflow_execute_with_valid_credentials(self, runner, valid_credentials_file, sample_workflow_file, 
+                                                   patched_cli):
         """Test that workflow execute succeeds with valid credentials."""
-        runner = CliRunner()
+        result = runner.invoke(cli, [
+            'workflow', 'execute', 
+            sample_workflow_file,
+            '--credentials', valid_credentials_file
+        ])
         
-        with patch('src.automata.auth.config.AuthenticationConfig', return_value=mock_auth_config), \
-             patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
-            
-            result = runner.invoke(cli, [
-                'workflow', 'execute', 
-                sample_workflow_file,
-                '--credentials', valid_credentials_file
-            ])
-            
-            assert result.exit_code == 0
-            assert "Credentials loaded from:" in result.output
-            assert "Workflow executed successfully with 4 steps" in result.output
-            
-            # Verify that authentication was called with correct parameters
-            mock_auth_config.authenticate.assert_called_once_with(
-                method="credentials_json",
-                path=valid_credentials_file
-            )
-            
-            # Verify that credentials were injected into variable manager
-            assert mock_workflow_engine.variable_manager.bulk_set_variables.call_count == 3
-            mock_workflow_engine.variable_manager.bulk_set_variables.assert_any_call({
-                "username": "testuser",
-                "password": "testpass123",
-                "email": "testuser@example.com"
-            })
-            mock_workflow_engine.variable_manager.bulk_set_variables.assert_any_call({
-                "base_url": "https://api.example.com",
-                "timeout": 30
-            })
-            mock_workflow_engine.variable_manager.bulk_set_variables.assert_any_call({
-                "user_id": "12345",
-                "preferences": {
-                    "theme": "dark"
-                }
-            })
-
-    @pytest.mark.unit
-    @pytest.mark.cli
-    @pytest.mark.auth
-    def test_workflow_execute_with_minimal_credentials(self, minimal_credentials_file, sample_workflow_file,
-                                                      mock_auth_config, mock_workflow_engine, mock_workflow_builder):
-        """Test that workflow execute succeeds with minimal credentials."""
-        runner = CliRunner()
+        assert result.exit_code == 0
+        assert "Credentials loaded from:" in result.output
+        assert "Workflow executed successfully with 4 steps" in result.output
         
-        with patch('src.automata.auth.config.AuthenticationConfig', return_value=mock_auth_config), \
-             patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
-            
-            result = runner.invoke(cli, [
-                'workflow', 'execute', 
-                sample_workflow_file,
-                '--credentials', minimal_credentials_file
-            ])
-            
-            assert result.exit_code == 0
-            assert "Credentials loaded from:" in result.output
-            assert "Workflow executed successfully with 4 steps" in result.output
+        # Verify that authentication was called with correct parameters
+        patched_cli.auth.authenticate.assert_called_once_with(
+            method="credentials_json",
+            path=valid_credentials_file
+        )
+        
+        # Verify that credentials were injected into variable manager
+        assert patched_cli.engine.variable_manager.bulk_set_variables.call_count == 3
+        patched_cli.engine.variable_manager.bulk_set_variables.assert_any_call({
+            "username": "testuser",
+            "password": "testpass123",
+            "email": "testuser@example.com"
+        })
+        patched_cli.engine.variable_manager.bulk_set_variables.assert_any_call({
+            "base_url": "https://api.example.com",
+            "timeout": 30
+        })
+        patched_cli.engine.variable_manager.bulk_set_variables.assert_any_call({
+            "user_id": "12345",
+            "preferences": {
+                "theme": "dark"
+            }
+        })
 
     @pytest.mark.unit
     @pytest.mark.cli
     @pytest.mark.auth
-    def test_workflow_execute_without_credentials(self, sample_workflow_file, mock_workflow_engine, mock_workflow_builder):
+    def test_workflow_execute_without_credentials(self, runner, sample_workflow_file, cli_mocks):
         """Test that workflow execute succeeds without credentials."""
-        runner = CliRunner()
-        
-        with patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
+        with patch.object(*_ENGINE_TARGET, return_value=cli_mocks.engine), \
+             patch.object(*_BUILDER_TARGET, return_value=cli_mocks.builder):
             
             result = runner.invoke(cli, [
                 'workflow', 'execute', 
@@ -281,48 +263,40 @@ class TestCliCredentials:
     @pytest.mark.unit
     @pytest.mark.cli
     @pytest.mark.auth
-    def test_workflow_execute_with_authentication_failure(self, valid_credentials_file, sample_workflow_file,
-                                                          mock_auth_config, mock_workflow_engine, mock_workflow_builder):
+    def test_workflow_execute_with_authentication_failure(self, runner, valid_credentials_file, sample_workflow_file,
+                                                          patched_cli):
         """Test that workflow execute fails when authentication fails."""
         # Configure mock to return authentication failure
-        mock_auth_config.authenticate.return_value = {
+        patched_cli.auth.authenticate.return_value = {
             "success": False,
             "error": "Invalid credentials"
         }
         
-        runner = CliRunner()
+        result = runner.invoke(cli, [
+            'workflow', 'execute', 
+            sample_workflow_file,
+            '--credentials', valid_credentials_file
+        ])
         
-        with patch('src.automata.auth.config.AuthenticationConfig', return_value=mock_auth_config), \
-             patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
-            
-            result = runner.invoke(cli, [
-                'workflow', 'execute', 
-                sample_workflow_file,
-                '--credentials', valid_credentials_file
-            ])
-            
-            assert result.exit_code == 1
-            assert "Error loading credentials: Invalid credentials" in result.output
-            
-            # Verify that authentication was called
-            mock_auth_config.authenticate.assert_called_once_with(
-                method="credentials_json",
-                path=valid_credentials_file
-            )
-            
-            # Verify that workflow execution was not called
-            mock_workflow_engine.execute_workflow.assert_not_called()
+        assert result.exit_code == 1
+        assert "Error loading credentials: Invalid credentials" in result.output
+        
+        # Verify that authentication was called
+        patched_cli.auth.authenticate.assert_called_once_with(
+            method="credentials_json",
+            path=valid_credentials_file
+        )
+        
+        # Verify that workflow execution was not called
+        assert patched_cli.engine.execute_workflow.calls == []
 
     @pytest.mark.unit
     @pytest.mark.cli
     @pytest.mark.auth
-    def test_workflow_execute_with_nonexistent_credentials_file(self, sample_workflow_file, mock_workflow_engine, mock_workflow_builder):
+    def test_workflow_execute_with_nonexistent_credentials_file(self, runner, sample_workflow_file, cli_mocks):
         """Test that workflow execute fails with a non-existent credentials file."""
-        runner = CliRunner()
-        
-        with patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
+        with patch.object(*_ENGINE_TARGET, return_value=cli_mocks.engine), \
+             patch.object(*_BUILDER_TARGET, return_value=cli_mocks.builder):
             
             result = runner.invoke(cli, [
                 'workflow', 'execute', 
@@ -337,128 +311,87 @@ class TestCliCredentials:
     @pytest.mark.unit
     @pytest.mark.cli
     @pytest.mark.auth
-    def test_workflow_execute_with_invalid_credentials_file(self, invalid_json_file, sample_workflow_file,
-                                                           mock_auth_config, mock_workflow_engine, mock_workflow_builder):
+    def test_workflow_execute_with_invalid_credentials_file(self, runner, invalid_json_file, sample_workflow_file,
+                                                           patched_cli):
         """Test that workflow execute fails with an invalid credentials file."""
         # Configure mock to return authentication failure
-        mock_auth_config.authenticate.return_value = {
+        patched_cli.auth.authenticate.return_value = {
             "success": False,
             "error": "Failed to load credentials from JSON file"
         }
         
-        runner = CliRunner()
+        result = runner.invoke(cli, [
+            'workflow', 'execute', 
+            sample_workflow_file,
+            '--credentials', invalid_json_file
+        ])
         
-        with patch('src.automata.auth.config.AuthenticationConfig', return_value=mock_auth_config), \
-             patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
-            
-            result = runner.invoke(cli, [
-                'workflow', 'execute', 
-                sample_workflow_file,
-                '--credentials', invalid_json_file
-            ])
-            
-            assert result.exit_code == 1
-            assert "Error loading credentials: Failed to load credentials from JSON file" in result.output
+        assert result.exit_code == 1
+        assert "Error loading credentials: Failed to load credentials from JSON file" in result.output
 
     @pytest.mark.unit
     @pytest.mark.cli
     @pytest.mark.auth
-    def test_workflow_execute_with_workflow_execution_failure(self, valid_credentials_file, sample_workflow_file,
-                                                             mock_auth_config, mock_workflow_engine, mock_workflow_builder):
+    def test_workflow_execute_with_workflow_execution_failure(self, runner, valid_credentials_file, sample_workflow_file,
+                                                             patched_cli):
         """Test that workflow execute handles workflow execution failure."""
         # Configure mock to return workflow execution failure
-        mock_workflow_engine.execute_workflow.return_value = [
-            {"status": "completed", "step_name": "Navigate to page"},
-            {"status": "failed", "step_name": "Login", "error": "Element not found"},
-            {"status": "skipped", "step_name": "Enter password"},
-            {"status": "skipped", "step_name": "Submit"}
-        ]
+        patched_cli.engine.execute_workflow.return_value = _STEPS_MIXED
         
-        runner = CliRunner()
+        result = runner.invoke(cli, [
+            'workflow', 'execute', 
+            sample_workflow_file,
+            '--credentials', valid_credentials_file
+        ])
         
-        with patch('src.automata.auth.config.AuthenticationConfig', return_value=mock_auth_config), \
-             patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
-            
-            result = runner.invoke(cli, [
-                'workflow', 'execute', 
-                sample_workflow_file,
-                '--credentials', valid_credentials_file
-            ])
-            
-            assert result.exit_code == 0
-            assert "Credentials loaded from:" in result.output
-            assert "Workflow executed successfully with 4 steps" in result.output
-            assert "Completed: 1, Failed: 1, Skipped: 2" in result.output
-            assert "- Login: Element not found" in result.output
+        assert result.exit_code == 0
+        assert "Credentials loaded from:" in result.output
+        assert "Workflow executed successfully with 4 steps" in result.output
+        assert "Completed: 1, Failed: 1, Skipped: 2" in result.output
+        assert "- Login: Element not found" in result.output
 
     @pytest.mark.unit
     @pytest.mark.cli
     @pytest.mark.auth
-    def test_workflow_execute_with_exception(self, valid_credentials_file, sample_workflow_file,
-                                            mock_auth_config, mock_workflow_engine, mock_workflow_builder):
+    def test_workflow_execute_with_exception(self, runner, valid_credentials_file, sample_workflow_file,
+                                            patched_cli):
         """Test that workflow execute handles exceptions during workflow execution."""
         # Configure mock to raise an exception
-        mock_workflow_engine.execute_workflow.side_effect = Exception("Workflow execution error")
+        patched_cli.engine.execute_workflow.side_effect = Exception("Workflow execution error")
         
-        runner = CliRunner()
+        result = runner.invoke(cli, [
+            'workflow', 'execute', 
+            sample_workflow_file,
+            '--credentials', valid_credentials_file
+        ])
         
-        with patch('src.automata.auth.config.AuthenticationConfig', return_value=mock_auth_config), \
-             patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
-            
-            result = runner.invoke(cli, [
-                'workflow', 'execute', 
-                sample_workflow_file,
-                '--credentials', valid_credentials_file
-            ])
-            
-            assert result.exit_code == 1
-            assert "Error executing workflow: Workflow execution error" in result.output
+        assert result.exit_code == 1
+        assert "Error executing workflow: Workflow execution error" in result.output
 
     @pytest.mark.unit
     @pytest.mark.cli
     @pytest.mark.auth
-    def test_workflow_execute_with_verbose_flag(self, valid_credentials_file, sample_workflow_file,
-                                               mock_auth_config, mock_workflow_engine, mock_workflow_builder):
-        """Test that workflow execute works with the verbose flag."""
-        runner = CliRunner()
-        
-        with patch('src.automata.auth.config.AuthenticationConfig', return_value=mock_auth_config), \
-             patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
-            
-            result = runner.invoke(cli, [
-                '--verbose',
-                'workflow', 'execute', 
-                sample_workflow_file,
-                '--credentials', valid_credentials_file
-            ])
-            
-            assert result.exit_code == 0
-            assert "Credentials loaded from:" in result.output
-            assert "Workflow executed successfully with 4 steps" in result.output
+    @pytest.mark.parametrize(
+        "pre_args,creds",
+        [
+            ([], "minimal"),
+            (["--verbose"], "valid"),
+            (["--config", "/path/to/config.json"], "valid"),
+        ],
+        ids=["minimal_credentials", "verbose_flag", "config_flag"],
+    )
+    def test_workflow_execute_succeeds_with_credentials(self, request, runner, pre_args, creds,
+                                                        sample_workflow_file, patched_cli):
+        """Test that workflow execute succeeds across credentials files and global flags."""
+        credentials_file = request.getfixturevalue(f"{creds}_credentials_file")
 
-    @pytest.mark.unit
-    @pytest.mark.cli
-    @pytest.mark.auth
-    def test_workflow_execute_with_config_flag(self, valid_credentials_file, sample_workflow_file,
-                                              mock_auth_config, mock_workflow_engine, mock_workflow_builder):
-        """Test that workflow execute works with the config flag."""
-        runner = CliRunner()
-        
-        with patch('src.automata.auth.config.AuthenticationConfig', return_value=mock_auth_config), \
-             patch('src.automata.cli.main.WorkflowExecutionEngine', return_value=mock_workflow_engine), \
-             patch('src.automata.cli.main.WorkflowBuilder', return_value=mock_workflow_builder):
-            
-            result = runner.invoke(cli, [
-                '--config', '/path/to/config.json',
-                'workflow', 'execute', 
-                sample_workflow_file,
-                '--credentials', valid_credentials_file
-            ])
-            
-            assert result.exit_code == 0
-            assert "Credentials loaded from:" in result.output
-            assert "Workflow executed successfully with 4 steps" in result.output
+        result = runner.invoke(cli, [
+            *pre_args,
+            'workflow', 'execute',
+            sample_workflow_file,
+            '--credentials', credentials_file
+        ])
+
+        assert result.exit_code == 0
+        assert "Credentials loaded from:" in result.output
+        assert "Workflow executed successfully with 4 steps" in result.output
@@ -2,262 +2,310 @@
 Tests for the JSON credentials authentication provider.
 """
 
-import asyncio
+import copy
 import json
 import os
+import re
+import shutil
 import stat
-import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import patch, MagicMock, AsyncMock
+from typing import Any, Dict
+from unittest.mock import patch, mock_open, MagicMock, AsyncMock
 
 import pytest
 
 from src.automata.auth.credentials_json import CredentialsJsonAuthProvider, CredentialsJsonWebAuthenticator
 from src.automata.auth.base import AuthResult, AuthMethod
 
+# Every test here is a unit auth test. The async tests already share one event loop
+# through asyncio_default_test_loop_scope in pytest.ini, so this module needs no
+# event_loop fixture of its own.
+pytestmark = [pytest.mark.unit, pytest.mark.auth]
+
+# Result messages, compiled once and matched with search()
+_MSG_AUTHENTICATED = re.compile("Authenticated using JSON credentials file")
+_MSG_NO_PATH = re.compile("No JSON credentials file path provided")
+_MSG_LOAD_FAILED = re.compile("Failed to load credentials from JSON file")
+_MSG_INVALID_FORMAT = re.compile("Invalid credentials format")
+_MSG_WEB_SUCCESS = re.compile(r"Web authentication successful for user: (\S+)")
+_MSG_WEB_FAILED = re.compile("Web authentication failed using JSON credentials")
+_MSG_NO_USERNAME = re.compile("Username not found in JSON credentials file")
+_MSG_NO_PASSWORD = re.compile("Password not found in JSON credentials file")
+
+# The provider reads credentials files with the builtin open() looked up in its module
+_OPEN_TARGET = "src.automata.auth.credentials_json.open"
+
+# Payloads written by the file fixtures; tests compare against these instead of literals
+_VALID_PAYLOAD = {
+    "credentials": {
+        "username": "testuser",
+        "password": "testpass123",
+        "email": "testuser@example.com"
+    },
+    "config": {
+        "base_url": "https://api.example.com",
+        "timeout": 30
+    },
+    "custom_fields": {
+        "user_id": "12345",
+        "preferences": {
+            "theme": "dark"
+        }
+    }
+}
+
+_MINIMAL_PAYLOAD = {
+    "credentials": {
+        "username": "testuser",
+        "password": "testpass123"
+    },
+    "config": {}
+}
+
+_MISSING_CREDENTIALS_PAYLOAD = {
+    "config": {
+        "base_url": "https://api.example.com"
+    },
+    "custom_fields": {
+        "user_id": "12345"
+    }
+}
+
+_MISSING_CONFIG_PAYLOAD = {
+    "credentials": {
+        "username": "testuser",
+        "password": "testpass123"
+    },
+    "custom_fields": {
+        "user_id": "12345"
+    }
+}
 
-@pytest.fixture
+
+_NO_USERNAME_PAYLOAD = {"credentials": {"password": "testpass123"}, "config": {}}
+
+_NO_PASSWORD_PAYLOAD = {"credentials": {"username": "testuser"}, "config": {}}
+
+# Every JSON payload written by cred_files, keyed by file name
+_PAYLOADS = {
+    "valid": _VALID_PAYLOAD,
+    "minimal": _MINIMAL_PAYLOAD,
+    "missing_credentials": _MISSING_CREDENTIALS_PAYLOAD,
+    "missing_config": _MISSING_CONFIG_PAYLOAD,
+    "no_username": _NO_USERNAME_PAYLOAD,
+    "no_password": _NO_PASSWORD_PAYLOAD,
+}
+
+
+@dataclass(frozen=True)
+class CredFile:
+    """A credentials file on disk together with the payload written to it."""
+
+    path: str
+    data: Dict[str, Any]
+
+
+def _write_credentials(path, content):
+    """Write content to path, created with the owner-only permissions the provider requires."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IRUSR | stat.S_IWUSR)
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
 def auth_provider():
-    """Create a credentials JSON authentication provider for testing."""
-    return CredentialsJsonAuthProvider()
+    """Create one credentials JSON authentication provider shared by the module."""
+    provider = CredentialsJsonAuthProvider()
+    initial_state = copy.deepcopy(vars(provider))
+    yield provider
+    # The provider is shared, so no test may leave state behind on it
+    assert vars(provider) == initial_state
+
+
+@pytest.fixture(scope="session")
+def cred_files(tmp_path_factory):
+    """Write every credentials file in one pass and map each name to its path."""
+    directory = tmp_path_factory.mktemp("creds")
+    contents = {name: json.dumps(payload).encode() for name, payload in _PAYLOADS.items()}
+    contents["invalid"] = b'{"invalid": json}'
+    return {
+        name: _write_credentials(directory / f"{name}.json", content)
+        for name, content in contents.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_engine():
+    """Create one mock automation engine shared by the web authenticator tests."""
+    return MagicMock()
 
 
 @pytest.fixture
-def web_authenticator():
+def web_authenticator(mock_engine):
     """Create a credentials JSON web authenticator for testing."""
-    mock_engine = MagicMock()
+    # The engine is shared, so drop calls recorded by earlier tests
+    mock_engine.reset_mock()
     return CredentialsJsonWebAuthenticator(mock_engine)
 
 
 @pytest.fixture
-def valid_credentials_file():
+def mocked_web_authenticator(web_authenticator):
+    """Create a web authenticator whose browser steps are mocked to succeed."""
+    web_authenticator.navigate_to_login = AsyncMock()
+    web_authenticator.fill_login_form = AsyncMock()
+    web_authenticator.wait_for_login_completion = AsyncMock(return_value=True)
+    return web_authenticator
+
+
+@pytest.fixture(scope="session")
+def valid_credentials_file(cred_files):
     """Create a valid credentials file for testing."""
-    credentials_data = {
-        "credentials": {
-            "username": "testuser",
-            "password": "testpass123",
-            "email": "testuser@example.com"
-        },
-        "config": {
-            "base_url": "https://api.example.com",
-            "timeout": 30
-        },
-        "custom_fields": {
-            "user_id": "12345",
-            "preferences": {
-                "theme": "dark"
-            }
-        }
-    }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(credentials_data, f, indent=2)
-        return f.name
+    return CredFile(cred_files["valid"], _VALID_PAYLOAD)
 
 
-@pytest.fixture
-def minimal_credentials_file():
+@pytest.fixture(scope="session")
+def minimal_credentials_file(cred_files):
     """Create a minimal credentials file for testing."""
-    credentials_data = {
-        "credentials": {
-            "username": "testuser",
-            "password": "testpass123"
-        },
-        "config": {}
-    }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(credentials_data, f, indent=2)
-        return f.name
+    return CredFile(cred_files["minimal"], _MINIMAL_PAYLOAD)
 
 
-@pytest.fixture
-def invalid_json_file():
+@pytest.fixture(scope="session")
+def invalid_json_file(cred_files):
     """Create an invalid JSON file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        f.write('{"invalid": json}')
-        return f.name
+    return cred_files["invalid"]
 
 
-@pytest.fixture
-def missing_credentials_file():
+@pytest.fixture(scope="session")
+def missing_credentials_file(cred_files):
     """Create a credentials file missing the credentials section."""
-    credentials_data = {
-        "config": {
-            "base_url": "https://api.example.com"
-        },
-        "custom_fields": {
-            "user_id": "12345"
-        }
-    }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(credentials_data, f, indent=2)
-        return f.name
+    return CredFile(cred_files["missing_credentials"], _MISSING_CREDENTIALS_PAYLOAD)
 
 
-@pytest.fixture
-def missing_config_file():
+@pytest.fixture(scope="session")
+def missing_config_file(cred_files):
     """Create a credentials file missing the config section."""
-    credentials_data = {
-        "credentials": {
-            "username": "testuser",
-            "password": "testpass123"
-        },
-        "custom_fields": {
-            "user_id": "12345"
-        }
-    }
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(credentials_data, f, indent=2)
-        return f.name
+    return CredFile(cred_files["missing_config"], _MISSING_CONFIG_PAYLOAD)
+
+
+@pytest.fixture(scope="session")
+def broken_credentials_files(cred_files):
+    """Create credentials files missing the username or the password, keyed by case."""
+    return {key: cred_files[key] for key in ("no_username", "no_password")}
 
 
 @pytest.fixture
-def readable_permissions_file(valid_credentials_file):
+def readable_permissions_file(valid_credentials_file, tmp_path):
     """Create a credentials file with readable permissions."""
+    # Work on a copy so the shared session file keeps its owner-only permissions
+    credentials_file = tmp_path / "readable.json"
+    shutil.copyfile(valid_credentials_file.path, credentials_file)
+    
     # Set file permissions to be readable by others
-    os.chmod(valid_credentials_file, stat.S_IRUSR | stat.S_IWUSR | stat.S_IROTH)
-    return valid_credentials_file
+    os.chmod(credentials_file, stat.S_IRUSR | stat.S_IWUSR | stat.S_IROTH)
+    return str(credentials_file)
 
 
 @pytest.fixture
-def git_directory_file():
+def git_directory_file(tmp_path):
     """Create a credentials file in a git directory."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a .git directory
-        git_dir = Path(temp_dir) / ".git"
-        git_dir.mkdir()
-        
-        # Create credentials file
-        credentials_file = Path(temp_dir) / "credentials.json"
-        credentials_data = {
-            "credentials": {
-                "username": "testuser",
-                "password": "testpass123"
-            },
-            "config": {}
-        }
-        
-        with open(credentials_file, 'w') as f:
-            json.dump(credentials_data, f, indent=2)
-        
-        return str(credentials_file)
+    # Create a .git directory
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    
+    # Create credentials file
+    return _write_credentials(tmp_path / "credentials.json", json.dumps(_MINIMAL_PAYLOAD).encode())
 
 
 class TestCredentialsJsonAuthProvider:
     """Test cases for the CredentialsJsonAuthProvider class."""
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_is_available_with_valid_file(self, auth_provider, valid_credentials_file):
         """Test that is_available returns True for a valid credentials file."""
-        result = await auth_provider.is_available(path=valid_credentials_file)
+        result = await auth_provider.is_available(path=valid_credentials_file.path)
         assert result is True
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_is_available_with_no_path(self, auth_provider):
         """Test that is_available returns False when no path is provided."""
         result = await auth_provider.is_available()
         assert result is False
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_is_available_with_nonexistent_file(self, auth_provider):
         """Test that is_available returns False for a non-existent file."""
         result = await auth_provider.is_available(path="/nonexistent/file.json")
         assert result is False
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_is_available_with_invalid_permissions(self, auth_provider, readable_permissions_file):
         """Test that is_available returns False for a file with invalid permissions."""
         result = await auth_provider.is_available(path=readable_permissions_file)
         assert result is False
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_is_available_with_git_directory(self, auth_provider, git_directory_file):
         """Test that is_available returns False for a file in a git directory."""
         result = await auth_provider.is_available(path=git_directory_file)
         assert result is False
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_authenticate_with_valid_file(self, auth_provider, valid_credentials_file):
         """Test that authenticate succeeds with a valid credentials file."""
-        result = await auth_provider.authenticate(path=valid_credentials_file)
+        result = await auth_provider.authenticate(path=valid_credentials_file.path)
         
         assert result.success is True
-        assert "Authenticated using JSON credentials file" in result.message
-        assert result.data["credentials_file"] == valid_credentials_file
-        assert result.data["credentials"]["username"] == "***"
-        assert result.data["credentials"]["password"] == "***"
-        assert result.session_data["credentials"]["username"] == "testuser"
-        assert result.session_data["credentials"]["password"] == "testpass123"
+        assert _MSG_AUTHENTICATED.search(result.message)
+        assert result.data["credentials_file"] == valid_credentials_file.path
+        credentials = valid_credentials_file.data["credentials"]
+        assert result.data["credentials"] == {key: "***" for key in credentials}
+        assert result.session_data["credentials"] == credentials
         assert result.session_data["auth_method"] == AuthMethod.CREDENTIALS_JSON.value
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_authenticate_with_minimal_file(self, auth_provider, minimal_credentials_file):
         """Test that authenticate succeeds with a minimal credentials file."""
-        result = await auth_provider.authenticate(path=minimal_credentials_file)
+        result = await auth_provider.authenticate(path=minimal_credentials_file.path)
         
         assert result.success is True
-        assert result.session_data["credentials"]["username"] == "testuser"
-        assert result.session_data["credentials"]["password"] == "testpass123"
+        assert result.session_data["credentials"] == minimal_credentials_file.data["credentials"]
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_authenticate_with_no_path(self, auth_provider):
         """Test that authenticate fails when no path is provided."""
         result = await auth_provider.authenticate()
         
         assert result.success is False
-        assert "No JSON credentials file path provided" in result.message
+        assert _MSG_NO_PATH.search(result.message)
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_authenticate_with_invalid_json(self, auth_provider, invalid_json_file):
         """Test that authenticate fails with invalid JSON."""
         result = await auth_provider.authenticate(path=invalid_json_file)
         
         assert result.success is False
-        assert "Failed to load credentials from JSON file" in result.message
+        assert _MSG_LOAD_FAILED.search(result.message)
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_authenticate_with_missing_credentials(self, auth_provider, missing_credentials_file):
         """Test that authenticate fails when credentials section is missing."""
-        result = await auth_provider.authenticate(path=missing_credentials_file)
+        result = await auth_provider.authenticate(path=missing_credentials_file.path)
         
         assert result.success is False
-        assert "Invalid credentials format" in result.message
+        assert _MSG_INVALID_FORMAT.search(result.message)
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
     async def test_authenticate_with_missing_config(self, auth_provider, missing_config_file):
         """Test that authenticate fails when config section is missing."""
-        result = await auth_provider.authenticate(path=missing_config_file)
+        result = await auth_provider.authenticate(path=missing_config_file.path)
         
         assert result.success is False
-        assert "Invalid credentials format" in result.message
+        assert _MSG_INVALID_FORMAT.search(result.message)
 
-    @pytest.mark.unit
-    @pytest.mark.auth
     def test_get_credentials(self, auth_provider):
         """Test that get_credentials extracts credentials from session data."""
         session_data = {
@@ -276,8 +324,6 @@ class TestCredentialsJsonAuthProvider:
             "password": "testpass123"
         }
 
-    @pytest.mark.unit
-    @pytest.mark.auth
     def test_get_config(self, auth_provider):
         """Test that get_config extracts config from session data."""
         session_data = {
@@ -295,8 +341,6 @@ class TestCredentialsJsonAuthProvider:
             "base_url": "https://api.example.com"
         }
 
-    @pytest.mark.unit
-    @pytest.mark.auth
     def test_get_custom_fields(self, auth_provider):
         """Test that get_custom_fields extracts custom fields from session data."""
         session_data = {
@@ -321,108 +365,44 @@ class TestCredentialsJsonAuthProvider:
             }
         }
 
-    @pytest.mark.unit
-    @pytest.mark.auth
-    def test_validate_credentials_format_with_valid_data(self, auth_provider):
-        """Test that _validate_credentials_format returns None for valid data."""
-        data = {
-            "credentials": {
-                "username": "testuser",
-                "password": "testpass123"
-            },
-            "config": {}
-        }
-        
-        error = auth_provider._validate_credentials_format(data)
-        assert error is None
-
-    @pytest.mark.unit
-    @pytest.mark.auth
-    def test_validate_credentials_format_with_non_dict(self, auth_provider):
-        """Test that _validate_credentials_format returns error for non-dict data."""
-        data = "not a dict"
-        
-        error = auth_provider._validate_credentials_format(data)
-        assert error == "Credentials data must be a dictionary"
-
-    @pytest.mark.unit
-    @pytest.mark.auth
-    def test_validate_credentials_format_with_missing_credentials(self, auth_provider):
-        """Test that _validate_credentials_format returns error when credentials section is missing."""
-        data = {
-            "config": {}
-        }
-        
-        error = auth_provider._validate_credentials_format(data)
-        assert error == "Missing required section: credentials"
-
-    @pytest.mark.unit
-    @pytest.mark.auth
-    def test_validate_credentials_format_with_missing_config(self, auth_provider):
-        """Test that _validate_credentials_format returns error when config section is missing."""
-        data = {
-            "credentials": {}
-        }
-        
-        error = auth_provider._validate_credentials_format(data)
-        assert error == "Missing required section: config"
-
-    @pytest.mark.unit
-    @pytest.mark.auth
-    def test_validate_credentials_format_with_invalid_credentials(self, auth_provider):
-        """Test that _validate_credentials_format returns error when credentials section is not a dict."""
-        data = {
-            "credentials": "not a dict",
-            "config": {}
-        }
-        
-        error = auth_provider._validate_credentials_format(data)
-        assert error == "Credentials section must be a dictionary"
-
-    @pytest.mark.unit
-    @pytest.mark.auth
-    def test_validate_credentials_format_with_invalid_config(self, auth_provider):
-        """Test that _validate_credentials_format returns error when config section is not a dict."""
-        data = {
-            "credentials": {},
-            "config": "not a dict"
-        }
-        
-        error = auth_provider._validate_credentials_format(data)
-        assert error == "Config section must be a dictionary"
-
-    @pytest.mark.unit
-    @pytest.mark.auth
-    def test_validate_credentials_format_with_invalid_custom_fields(self, auth_provider):
-        """Test that _validate_credentials_format returns error when custom_fields section is not a dict."""
-        data = {
-            "credentials": {},
-            "config": {},
-            "custom_fields": "not a dict"
-        }
-        
-        error = auth_provider._validate_credentials_format(data)
-        assert error == "Custom fields section must be a dictionary"
-
-    @pytest.mark.unit
-    @pytest.mark.auth
-    def test_load_json_credentials_with_valid_file(self, auth_provider, valid_credentials_file):
+    @pytest.mark.parametrize("data, expected", [
+        pytest.param(_MINIMAL_PAYLOAD, None, id="valid_data"),
+        pytest.param("not a dict", "Credentials data must be a dictionary", id="non_dict"),
+        pytest.param({"config": {}}, "Missing required section: credentials", id="missing_credentials"),
+        pytest.param({"credentials": {}}, "Missing required section: config", id="missing_config"),
+        pytest.param(
+            {"credentials": "not a dict", "config": {}},
+            "Credentials section must be a dictionary",
+            id="invalid_credentials",
+        ),
+        pytest.param(
+            {"credentials": {}, "config": "not a dict"},
+            "Config section must be a dictionary",
+            id="invalid_config",
+        ),
+        pytest.param(
+            {"credentials": {}, "config": {}, "custom_fields": "not a dict"},
+            "Custom fields section must be a dictionary",
+            id="invalid_custom_fields",
+        ),
+    ])
+    def test_validate_credentials_format(self, auth_provider, data, expected):
+        """Test that _validate_credentials_format returns None or the expected error."""
+        assert auth_provider._validate_credentials_format(data) == expected
+
+    def test_load_json_credentials_with_valid_file(self, auth_provider):
         """Test that _load_json_credentials loads data from a valid file."""
-        data = auth_provider._load_json_credentials(Path(valid_credentials_file))
+        # Serve the payload from memory; only the parsing is under test here
+        with patch(_OPEN_TARGET, mock_open(read_data=json.dumps(_VALID_PAYLOAD)), create=True):
+            data = auth_provider._load_json_credentials(Path("/fake/credentials.json"))
         
-        assert data is not None
-        assert data["credentials"]["username"] == "testuser"
-        assert data["config"]["base_url"] == "https://api.example.com"
+        assert data == _VALID_PAYLOAD
 
-    @pytest.mark.unit
-    @pytest.mark.auth
     def test_load_json_credentials_with_invalid_file(self, auth_provider, invalid_json_file):
         """Test that _load_json_credentials returns None for an invalid file."""
         data = auth_provider._load_json_credentials(Path(invalid_json_file))
         assert data is None
 
-    @pytest.mark.unit
-    @pytest.mark.auth
     def test_load_json_credentials_with_nonexistent_file(self, auth_provider):
         """Test that _load_json_credentials returns None for a non-existent file."""
         data = auth_provider._load_json_credentials(Path("/nonexistent/file.json"))
@@ -433,136 +413,81 @@ class TestCredentialsJsonWebAuthenticator:
     """Test cases for the CredentialsJsonWebAuthenticator class."""
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
-    async def test_authenticate_with_valid_credentials(self, web_authenticator, valid_credentials_file):
+    async def test_authenticate_with_valid_credentials(self, mocked_web_authenticator,
+                                                       valid_credentials_file):
         """Test that web authentication succeeds with valid credentials."""
-        # Mock the web authentication methods
-        web_authenticator.navigate_to_login = AsyncMock()
-        web_authenticator.fill_login_form = AsyncMock()
-        web_authenticator.wait_for_login_completion = AsyncMock(return_value=True)
-        
-        result = await web_authenticator.authenticate(
+        result = await mocked_web_authenticator.authenticate(
             login_url="https://example.com/login",
             username_selector="#username",
             password_selector="#password",
-            path=valid_credentials_file
+            path=valid_credentials_file.path
         )
         
         assert result.success is True
-        assert "Web authentication successful for user: testuser" in result.message
-        web_authenticator.navigate_to_login.assert_called_once_with("https://example.com/login")
-        web_authenticator.fill_login_form.assert_called_once_with(
+        credentials = valid_credentials_file.data["credentials"]
+        match = _MSG_WEB_SUCCESS.search(result.message)
+        assert match and match.group(1) == credentials["username"]
+        mocked_web_authenticator.navigate_to_login.assert_called_once_with("https://example.com/login")
+        mocked_web_authenticator.fill_login_form.assert_called_once_with(
             username_selector="#username",
-            username="testuser",
+            username=credentials["username"],
             password_selector="#password",
-            password="testpass123",
+            password=credentials["password"],
             submit_selector=None
         )
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
-    async def test_authenticate_with_login_failure(self, web_authenticator, valid_credentials_file):
+    async def test_authenticate_with_login_failure(self, mocked_web_authenticator,
+                                                   valid_credentials_file):
         """Test that web authentication fails when login fails."""
-        # Mock the web authentication methods
-        web_authenticator.navigate_to_login = AsyncMock()
-        web_authenticator.fill_login_form = AsyncMock()
-        web_authenticator.wait_for_login_completion = AsyncMock(return_value=False)
+        mocked_web_authenticator.wait_for_login_completion.return_value = False
         
-        result = await web_authenticator.authenticate(
+        result = await mocked_web_authenticator.authenticate(
             login_url="https://example.com/login",
             username_selector="#username",
             password_selector="#password",
-            path=valid_credentials_file
+            path=valid_credentials_file.path
         )
         
         assert result.success is False
-        assert "Web authentication failed using JSON credentials" in result.message
-
-    @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
-    async def test_authenticate_with_missing_username(self, web_authenticator, minimal_credentials_file):
-        """Test that web authentication fails when username is missing."""
-        # Create credentials file without username
-        credentials_data = {
-            "credentials": {
-                "password": "testpass123"
-            },
-            "config": {}
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(credentials_data, f, indent=2)
-            credentials_file = f.name
-        
-        try:
-            result = await web_authenticator.authenticate(
-                login_url="https://example.com/login",
-                username_selector="#username",
-                password_selector="#password",
-                path=credentials_file
-            )
-            
-            assert result.success is False
-            assert "Username not found in JSON credentials file" in result.message
-        finally:
-            os.unlink(credentials_file)
+        assert _MSG_WEB_FAILED.search(result.message)
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
-    async def test_authenticate_with_missing_password(self, web_authenticator, minimal_credentials_file):
-        """Test that web authentication fails when password is missing."""
-        # Create credentials file without password
-        credentials_data = {
-            "credentials": {
-                "username": "testuser"
-            },
-            "config": {}
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(credentials_data, f, indent=2)
-            credentials_file = f.name
+    @pytest.mark.parametrize("key, expected", [
+        ("no_username", _MSG_NO_USERNAME),
+        ("no_password", _MSG_NO_PASSWORD),
+    ])
+    async def test_authenticate_with_missing_field(self, web_authenticator, broken_credentials_files,
+                                                   key, expected):
+        """Test that web authentication fails when the username or password is missing."""
+        result = await web_authenticator.authenticate(
+            login_url="https://example.com/login",
+            username_selector="#username",
+            password_selector="#password",
+            path=broken_credentials_files[key]
+        )
         
-        try:
-            result = await web_authenticator.authenticate(
-                login_url="https://example.com/login",
-                username_selector="#username",
-                password_selector="#password",
-                path=credentials_file
-            )
-            
-            assert result.success is False
-            assert "Password not found in JSON credentials file" in result.message
-        finally:
-            os.unlink(credentials_file)
+        assert result.success is False
+        assert expected.search(result.message)
 
     @pytest.mark.asyncio
-    @pytest.mark.unit
-    @pytest.mark.auth
-    async def test_authenticate_with_submit_selector(self, web_authenticator, valid_credentials_file):
+    async def test_authenticate_with_submit_selector(self, mocked_web_authenticator,
+                                                     valid_credentials_file):
         """Test that web authentication uses submit selector when provided."""
-        # Mock the web authentication methods
-        web_authenticator.navigate_to_login = AsyncMock()
-        web_authenticator.fill_login_form = AsyncMock()
-        web_authenticator.wait_for_login_completion = AsyncMock(return_value=True)
-        
-        result = await web_authenticator.authenticate(
+        result = await mocked_web_authenticator.authenticate(
             login_url="https://example.com/login",
             username_selector="#username",
             password_selector="#password",
             submit_selector="#submit",
-            path=valid_credentials_file
+            path=valid_credentials_file.path
         )
         
         assert result.success is True
-        web_authenticator.fill_login_form.assert_called_once_with(
+        credentials = valid_credentials_file.data["credentials"]
+        mocked_web_authenticator.fill_login_form.assert_called_once_with(
             username_selector="#username",
-            username="testuser",
+            username=credentials["username"],
             password_selector="#password",
-            password="testpass123",
+            password=credentials["password"],
             submit_selector="#submit"
         )
@@ -5,21 +5,56 @@ Unit tests for the selector generator fragment functionality.
 import json
 import os
 import tempfile
+from contextlib import contextmanager
 import pytest
 from unittest.mock import patch, MagicMock
+from src.automata.tools import selector_generator
 from src.automata.tools.selector_generator import SelectorGenerator
 from src.automata.core.errors import AutomationError
 
 
+@contextmanager
+def _stdin(data: bytes):
+    """Replace sys.stdin with the read end of a real pipe preloaded with data (< 64 KiB)."""
+    read_fd, write_fd = os.pipe()
+    try:
+        os.write(write_fd, data)
+    finally:
+        os.close(write_fd)
+    with open(read_fd, "r", encoding="utf-8") as stream, patch("sys.stdin", stream):
+        yield stream
+
+
+@contextmanager
+def _tty_stdin():
+    """Replace sys.stdin with the slave end of a pseudo-terminal."""
+    master_fd, slave_fd = os.openpty()
+    try:
+        with open(slave_fd, "r", encoding="utf-8") as stream, patch("sys.stdin", stream):
+            yield stream
+    finally:
+        os.close(master_fd)
+
+
+@pytest.fixture(scope="class")
+def generator():
+    """One SelectorGenerator per class; its only mutable state is its result cache."""
+    return SelectorGenerator()
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache(generator):
+    """Empty the shared generator's result cache so each test runs the code under test."""
+    generator._result_cache.clear()
+
+
 @pytest.mark.unit
 @pytest.mark.helper
 class TestSelectorGeneratorFragments:
     """Test cases for SelectorGenerator fragment functionality."""
 
-    def test_is_html_fragment_with_complete_html(self):
+    def test_is_html_fragment_with_complete_html(self, generator):
         """Test HTML fragment detection with complete HTML document."""
-        generator = SelectorGenerator()
-        
         # Complete HTML with DOCTYPE
         complete_html = """<!DOCTYPE html>
 <html>
@@ -52,10 +87,8 @@ class TestSelectorGeneratorFragments:
         
         assert generator.is_html_fragment(body_only_html) is False
 
-    def test_is_html_fragment_with_fragments(self):
+    def test_is_html_fragment_with_fragments(self, generator):
         """Test HTML fragment detection with actual fragments."""
-        generator = SelectorGenerator()
-        
         # Simple fragment
         simple_fragment = "<div>Content</div>"
         assert generator.is_html_fragment(simple_fragment) is True
@@ -73,10 +106,32 @@ class TestSelectorGeneratorFragments:
 </div>"""
         assert generator.is_html_fragment(nested_fragment) is True
 
-    def test_is_html_fragment_with_empty_content(self):
-        """Test HTML fragment detection with empty content."""
-        generator = SelectorGenerator()
+    def test_is_html_fragment_ignores_leading_whitespace(self, generator):
+        """Test that leading whitespace does not push document markers out of the window."""
+        complete_html = "<!DOCTYPE html><html><body><div>Content</div></body></html>"
+        assert generator.is_html_fragment(" " * 5000 + complete_html) is False
+        assert generator.is_html_fragment("\n" * 5000 + "<html><body></body></html>") is False
+
+    def test_is_html_fragment_only_honours_doctype_at_start(self, generator):
+        """Test that a DOCTYPE inside a fragment does not mark it as a complete document."""
+        assert generator.is_html_fragment("<div>Content</div><!DOCTYPE html>") is True
+
+    def test_is_html_fragment_scans_only_a_prefix_window(self, generator):
+        """Test that document markers are found in the prefix window, even when cut by its edge."""
+        padding = "<!-- " + "x" * 4084 + " -->"  # 4093 characters
         
+        # Body tag straddling the end of the window is still detected
+        assert generator.is_html_fragment(padding + "<body><div>Content</div></body>") is False
+        
+        # Markers far past the window are ignored
+        assert generator.is_html_fragment("<div>" + "y" * 8192 + "<body></div>") is True
+        
+        # ...even when an unrelated tag straddles the window edge
+        straddling = "<div>" + "x" * 4089 + "<span class='q'>y</span>" + "z" * 1000
+        assert generator.is_html_fragment(straddling + "<body>late</body>") is True
+
+    def test_is_html_fragment_with_empty_content(self, generator):
+        """Test HTML fragment detection with empty content."""
         # Empty string
         with pytest.raises(AutomationError, match="HTML content is empty"):
             generator.is_html_fragment("")
@@ -85,10 +140,8 @@ class TestSelectorGeneratorFragments:
         with pytest.raises(AutomationError, match="HTML content is empty"):
             generator.is_html_fragment("   \n\t  ")
 
-    def test_wrap_html_fragment_with_valid_fragment(self):
+    def test_wrap_html_fragment_with_valid_fragment(self, generator):
         """Test HTML fragment wrapping with valid fragment."""
-        generator = SelectorGenerator()
-        
         fragment = "<div>Content</div>"
         wrapped = generator.wrap_html_fragment(fragment)
         
@@ -100,10 +153,8 @@ class TestSelectorGeneratorFragments:
         assert "</body>" in wrapped
         assert "</html>" in wrapped
 
-    def test_wrap_html_fragment_with_complex_fragment(self):
+    def test_wrap_html_fragment_with_complex_fragment(self, generator):
         """Test HTML fragment wrapping with complex fragment."""
-        generator = SelectorGenerator()
-        
         complex_fragment = """<div class="container">
     <h1 id="title">Test Title</h1>
     <form>
@@ -122,10 +173,8 @@ class TestSelectorGeneratorFragments:
         assert "</body>" in wrapped
         assert "</html>" in wrapped
 
-    def test_wrap_html_fragment_with_empty_content(self):
+    def test_wrap_html_fragment_with_empty_content(self, generator):
         """Test HTML fragment wrapping with empty content."""
-        generator = SelectorGenerator()
-        
         # Empty string
         with pytest.raises(AutomationError, match="HTML fragment is empty"):
             generator.wrap_html_fragment("")
@@ -134,10 +183,8 @@ class TestSelectorGeneratorFragments:
         with pytest.raises(AutomationError, match="HTML fragment is empty"):
             generator.wrap_html_fragment("   \n\t  ")
 
-    def test_wrap_html_fragment_with_invalid_content(self):
+    def test_wrap_html_fragment_with_invalid_content(self, generator):
         """Test HTML fragment wrapping with invalid content."""
-        generator = SelectorGenerator()
-        
         # No HTML tags
         with pytest.raises(AutomationError, match="HTML fragment does not contain any valid HTML tags"):
             generator.wrap_html_fragment("Just plain text")
@@ -154,10 +201,8 @@ class TestSelectorGeneratorFragments:
         assert "</body>" in wrapped
         assert "</html>" in wrapped
 
-    def test_generate_from_fragment_with_all_targeting_mode(self):
+    def test_generate_from_fragment_with_all_targeting_mode(self, generator):
         """Test generating selectors from fragment with 'all' targeting mode."""
-        generator = SelectorGenerator()
-        
         fragment = """<div class="container">
     <button id="submit-btn">Submit</button>
     <input type="text" name="username" placeholder="Username">
@@ -175,10 +220,8 @@ class TestSelectorGeneratorFragments:
         # Check that we have multiple elements
         assert len(results) >= 3  # button, input, and a tags
 
-    def test_generate_from_fragment_with_selector_targeting_mode(self):
+    def test_generate_from_fragment_with_selector_targeting_mode(self, generator):
         """Test generating selectors from fragment with 'selector' targeting mode."""
-        generator = SelectorGenerator()
-        
         fragment = """<div class="container">
     <button id="submit-btn">Submit</button>
     <input type="text" name="username" placeholder="Username">
@@ -209,10 +252,8 @@ class TestSelectorGeneratorFragments:
         assert "element_0" in results
         assert results["element_0"]["element_tag"] == "button"
 
-    def test_generate_from_fragment_with_auto_targeting_mode(self):
+    def test_generate_from_fragment_with_auto_targeting_mode(self, generator):
         """Test generating selectors from fragment with 'auto' targeting mode."""
-        generator = SelectorGenerator()
-        
         fragment = """<div class="container">
     <button id="submit-btn">Submit</button>
     <input type="text" name="username" placeholder="Username">
@@ -231,19 +272,15 @@ class TestSelectorGeneratorFragments:
         assert "input" in element_tags
         assert "a" in element_tags
 
-    def test_generate_from_fragment_with_invalid_targeting_mode(self):
+    def test_generate_from_fragment_with_invalid_targeting_mode(self, generator):
         """Test generating selectors from fragment with invalid targeting mode."""
-        generator = SelectorGenerator()
-        
         fragment = "<div>Content</div>"
         
         with pytest.raises(AutomationError, match="Invalid targeting mode"):
             generator.generate_from_fragment(fragment, targeting_mode="invalid")
 
-    def test_generate_from_fragment_with_empty_custom_selector(self):
+    def test_generate_from_fragment_with_empty_custom_selector(self, generator):
         """Test generating selectors from fragment with empty custom selector."""
-        generator = SelectorGenerator()
-        
         fragment = "<div>Content</div>"
         
         # Empty custom selector
@@ -262,10 +299,8 @@ class TestSelectorGeneratorFragments:
                 custom_selector="   "
             )
 
-    def test_generate_from_fragment_with_invalid_selector_type(self):
+    def test_generate_from_fragment_with_invalid_selector_type(self, generator):
         """Test generating selectors from fragment with invalid selector type."""
-        generator = SelectorGenerator()
-        
         fragment = "<div>Content</div>"
         
         with pytest.raises(AutomationError, match="Invalid selector type"):
@@ -276,17 +311,15 @@ class TestSelectorGeneratorFragments:
                 selector_type="invalid"
             )
 
-    def test_generate_from_fragment_file_with_valid_file(self):
+    def test_generate_from_fragment_file_with_valid_file(self, generator):
         """Test generating selectors from fragment file with valid file."""
-        generator = SelectorGenerator()
-        
         fragment = """<div class="container">
     <button id="submit-btn">Submit</button>
     <input type="text" name="username" placeholder="Username">
 </div>"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(fragment)
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.html', delete=False) as f:
+            f.write(fragment.encode('utf-8'))
             temp_file = f.name
         
         try:
@@ -298,27 +331,51 @@ class TestSelectorGeneratorFragments:
         finally:
             os.unlink(temp_file)
 
-    def test_generate_from_fragment_file_with_nonexistent_file(self):
-        """Test generating selectors from fragment file with nonexistent file."""
-        generator = SelectorGenerator()
+    def test_generate_from_fragment_file_normalizes_newlines(self, generator, tmp_path):
+        """Test that CRLF and CR line endings reach generate_from_fragment as plain newlines."""
+        fragment_file = tmp_path / "fragment.html"
+        fragment_file.write_bytes(
+            b"<div>\r\n    <button>Go</button>\r    <a href='#'>Home</a>\r\n</div>"
+        )
+        
+        with patch.object(generator, "generate_from_fragment", return_value={}) as mock_generate:
+            generator.generate_from_fragment_file(str(fragment_file), targeting_mode="all")
         
+        assert mock_generate.call_args.args[0] == (
+            "<div>\n    <button>Go</button>\n    <a href='#'>Home</a>\n</div>"
+        )
+
+    def test_generate_from_fragment_file_reads_files_reporting_zero_size(self, generator, tmp_path):
+        """Test that files whose stat size is 0, like /proc entries, are still read."""
+        fragment_file = tmp_path / "fragment.html"
+        fragment_file.write_bytes(b'<div><button id="go">Go</button></div>')
+        real_stat = os.stat(fragment_file)
+        zero_size_stat = os.stat_result(real_stat[:6] + (0,) + real_stat[7:])
+        
+        with patch.object(selector_generator.os, "stat", return_value=zero_size_stat):
+            results = generator.generate_from_fragment_file(
+                str(fragment_file), targeting_mode="all"
+            )
+        
+        assert [result["element_tag"] for result in results.values()] == [
+            "head", "title", "div", "button"
+        ]
+
+    def test_generate_from_fragment_file_with_nonexistent_file(self, generator):
+        """Test generating selectors from fragment file with nonexistent file."""
         with pytest.raises(AutomationError, match="File not found"):
             generator.generate_from_fragment_file("nonexistent.html", targeting_mode="all")
 
-    def test_generate_from_fragment_file_with_directory(self):
+    def test_generate_from_fragment_file_with_directory(self, generator):
         """Test generating selectors from fragment file with directory path."""
-        generator = SelectorGenerator()
-        
         with tempfile.TemporaryDirectory() as temp_dir:
             with pytest.raises(AutomationError, match="Path is not a file"):
                 generator.generate_from_fragment_file(temp_dir, targeting_mode="all")
 
-    def test_generate_from_fragment_file_with_empty_file(self):
+    def test_generate_from_fragment_file_with_empty_file(self, generator):
         """Test generating selectors from fragment file with empty file."""
-        generator = SelectorGenerator()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write("")
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.html', delete=False) as f:
+            f.write(b"")
             temp_file = f.name
         
         try:
@@ -327,53 +384,51 @@ class TestSelectorGeneratorFragments:
         finally:
             os.unlink(temp_file)
 
-    def test_generate_from_stdin_with_valid_input(self):
+    def test_generate_from_stdin_with_valid_input(self, generator):
         """Test generating selectors from stdin with valid input."""
-        generator = SelectorGenerator()
-        
         fragment = """<div class="container">
     <button id="submit-btn">Submit</button>
     <input type="text" name="username" placeholder="Username">
 </div>"""
         
-        # Mock stdin
-        with patch('sys.stdin') as mock_stdin:
-            mock_stdin.isatty.return_value = False
-            mock_stdin.read.return_value = fragment
-            
+        with _stdin(fragment.encode("utf-8")):
             results = generator.generate_from_stdin(targeting_mode="all")
             
             assert len(results) > 0
             assert "element_0" in results
             assert "selectors" in results["element_0"]
 
-    def test_generate_from_stdin_with_no_input(self):
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires pseudo-terminal support")
+    def test_generate_from_stdin_with_no_input(self, generator):
         """Test generating selectors from stdin with no input."""
-        generator = SelectorGenerator()
-        
-        # Mock stdin with no input
-        with patch('sys.stdin') as mock_stdin:
-            mock_stdin.isatty.return_value = True  # No input from stdin
-            
+        # An interactive terminal means nothing was piped in
+        with _tty_stdin():
             with pytest.raises(AutomationError, match="No HTML fragment provided via stdin"):
                 generator.generate_from_stdin(targeting_mode="all")
 
-    def test_generate_from_stdin_with_empty_input(self):
+    def test_generate_from_stdin_with_empty_input(self, generator):
         """Test generating selectors from stdin with empty input."""
-        generator = SelectorGenerator()
-        
-        # Mock stdin with empty input
-        with patch('sys.stdin') as mock_stdin:
-            mock_stdin.isatty.return_value = False
-            mock_stdin.read.return_value = ""
-            
+        with _stdin(b""):
             with pytest.raises(AutomationError, match="Empty HTML fragment provided via stdin"):
                 generator.generate_from_stdin(targeting_mode="all")
 
-    def test_backward_compatibility_with_complete_html_file(self):
-        """Test backward compatibility with complete HTML file."""
-        generator = SelectorGenerator()
+    def test_generate_from_stdin_rejects_invalid_utf8(self, generator):
+        """Test that undecodable stdin raises instead of being replaced with U+FFFD."""
+        with _stdin(b"<div>\xff\xfe</div>"):
+            with pytest.raises(AutomationError, match="Error generating selectors from stdin"):
+                generator.generate_from_stdin(targeting_mode="all")
+
+    def test_generate_from_stdin_normalizes_newlines(self, generator):
+        """Test that stdin line endings are normalized like the fragment file path."""
+        with _stdin(b"<div>\r\n    <button>Go</button>\r</div>"), patch.object(
+            generator, "generate_from_fragment", return_value={}
+        ) as mock_generate:
+            generator.generate_from_stdin(targeting_mode="all")
         
+        assert mock_generate.call_args.args[0] == "<div>\n    <button>Go</button>\n</div>"
+
+    def test_backward_compatibility_with_complete_html_file(self, generator):
+        """Test backward compatibility with complete HTML file."""
         complete_html = """<!DOCTYPE html>
 <html>
 <head>
@@ -387,8 +442,8 @@ class TestSelectorGeneratorFragments:
 </body>
 </html>"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(complete_html)
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.html', delete=False) as f:
+            f.write(complete_html.encode('utf-8'))
             temp_file = f.name
         
         try:
@@ -402,10 +457,8 @@ class TestSelectorGeneratorFragments:
         finally:
             os.unlink(temp_file)
 
-    def test_backward_compatibility_with_fragment_detection(self):
+    def test_backward_compatibility_with_fragment_detection(self, generator):
         """Test that complete HTML is not treated as fragment."""
-        generator = SelectorGenerator()
-        
         complete_html = """<!DOCTYPE html>
 <html>
 <head>
@@ -420,13 +473,14 @@ class TestSelectorGeneratorFragments:
         assert generator.is_html_fragment(complete_html) is False
         
         # Should not be wrapped when processed as fragment
-        results = generator.generate_from_fragment(complete_html, targeting_mode="all")
+        with patch.object(generator, "wrap_html_fragment") as mock_wrap:
+            results = generator.generate_from_fragment(complete_html, targeting_mode="all")
+        mock_wrap.assert_not_called()
         assert len(results) > 0
+        assert {result["element_tag"] for result in results.values()} == {"head", "title", "div"}
 
-    def test_get_all_elements_filters_wrapper_elements(self):
+    def test_get_all_elements_filters_wrapper_elements(self, generator):
         """Test that _get_all_elements filters out html and body wrapper elements."""
-        generator = SelectorGenerator()
-        
         # This will be wrapped by the fragment processing
         fragment = "<div>Content</div>"
         wrapped = generator.wrap_html_fragment(fragment)
@@ -441,10 +495,19 @@ class TestSelectorGeneratorFragments:
         assert "body" not in element_tags
         assert "div" in element_tags
 
-    def test_find_elements_by_selector_with_invalid_css_selector(self):
-        """Test _find_elements_by_selector with invalid CSS selector."""
-        generator = SelectorGenerator()
+    def test_get_all_elements_keeps_head_and_skips_root_without_body(self, generator):
+        """Test that only html and body are filtered, with or without a body element."""
+        from lxml import html
+        with_head = html.fromstring(
+            "<html><head><title>T</title></head><body><p>x</p></body></html>"
+        )
+        frameset = html.fromstring("<html><frameset><frame src='a.html'></frameset></html>")
         
+        assert [el.tag for el in generator._get_all_elements(with_head)] == ["head", "title", "p"]
+        assert [el.tag for el in generator._get_all_elements(frameset)] == ["frameset", "frame"]
+
+    def test_find_elements_by_selector_with_invalid_css_selector(self, generator):
+        """Test _find_elements_by_selector with invalid CSS selector."""
         fragment = "<div>Content</div>"
         wrapped = generator.wrap_html_fragment(fragment)
         
@@ -454,10 +517,8 @@ class TestSelectorGeneratorFragments:
         with pytest.raises(AutomationError, match="Invalid CSS selector"):
             generator._find_elements_by_selector(parsed_html, "invalid[selector", "css")
 
-    def test_find_elements_by_selector_with_invalid_xpath_selector(self):
+    def test_find_elements_by_selector_with_invalid_xpath_selector(self, generator):
         """Test _find_elements_by_selector with invalid XPath selector."""
-        generator = SelectorGenerator()
-        
         fragment = "<div>Content</div>"
         wrapped = generator.wrap_html_fragment(fragment)
         
@@ -467,10 +528,21 @@ class TestSelectorGeneratorFragments:
         with pytest.raises(AutomationError, match="Invalid XPath selector"):
             generator._find_elements_by_selector(parsed_html, "invalid[", "xpath")
 
-    def test_find_elements_by_selector_with_empty_selector(self):
-        """Test _find_elements_by_selector with empty selector."""
-        generator = SelectorGenerator()
+    def test_find_elements_by_selector_tag_fast_path_needs_exact_tag(self, generator):
+        """Test that a trailing newline keeps a tag selector off the tag-only fast path."""
+        from lxml import html
+        parsed_html = html.fromstring(generator.wrap_html_fragment("<div><button>Go</button></div>"))
+        
+        with patch.object(
+            selector_generator, "_compile_selector", wraps=selector_generator._compile_selector
+        ) as mock_compile:
+            elements = generator._find_elements_by_selector(parsed_html, "//button\n", "xpath")
         
+        mock_compile.assert_called_once_with("//button\n", "xpath")
+        assert [el.tag for el in elements] == ["button"]
+
+    def test_find_elements_by_selector_with_empty_selector(self, generator):
+        """Test _find_elements_by_selector with empty selector."""
         fragment = "<div>Content</div>"
         wrapped = generator.wrap_html_fragment(fragment)
         
@@ -480,10 +552,8 @@ class TestSelectorGeneratorFragments:
         with pytest.raises(AutomationError, match="Selector cannot be empty"):
             generator._find_elements_by_selector(parsed_html, "", "css")
 
-    def test_auto_detect_important_elements_finds_important_tags(self):
+    def test_auto_detect_important_elements_finds_important_tags(self, generator):
         """Test that _auto_detect_important_elements finds important tags."""
-        generator = SelectorGenerator()
-        
         fragment = """<div>
     <button>Button</button>
     <input type="text">
@@ -533,10 +603,8 @@ class TestSelectorGeneratorFragments:
         assert "li" in element_tags
         # span might be included if it has other important attributes, but not just for being a span
 
-    def test_auto_detect_important_elements_finds_elements_with_ids(self):
+    def test_auto_detect_important_elements_finds_elements_with_ids(self, generator):
         """Test that _auto_detect_important_elements finds elements with IDs."""
-        generator = SelectorGenerator()
-        
         fragment = """<div>
     <span id="special">Special span</span>
     <div>Regular div</div>
@@ -552,10 +620,8 @@ class TestSelectorGeneratorFragments:
         element_tags = [el.tag for el in important_elements]
         assert "span" in element_tags
 
-    def test_auto_detect_important_elements_finds_elements_with_test_attributes(self):
+    def test_auto_detect_important_elements_finds_elements_with_test_attributes(self, generator):
         """Test that _auto_detect_important_elements finds elements with test attributes."""
-        generator = SelectorGenerator()
-        
         fragment = """<div>
     <span data-testid="test-span">Test span</span>
     <div data-test="test-div">Test div</div>
@@ -577,10 +643,8 @@ class TestSelectorGeneratorFragments:
         assert "p" in element_tags
         assert "a" in element_tags
 
-    def test_auto_detect_important_elements_removes_duplicates(self):
+    def test_auto_detect_important_elements_removes_duplicates(self, generator):
         """Test that _auto_detect_important_elements removes duplicates."""
-        generator = SelectorGenerator()
-        
         fragment = """<div>
     <button id="submit-btn" data-testid="submit-button">Submit</button>
 </div>"""
@@ -594,3 +658,62 @@ class TestSelectorGeneratorFragments:
         # Should find the button only once, even though it has both important tag, ID, and test attribute
         assert len(important_elements) == 1
         assert important_elements[0].tag == "button"
+
+    def test_generate_from_fragment_with_many_elements_keeps_order(self, generator):
+        """Test that large fragments keep element order and numbering."""
+        fragment = "<ul>" + "".join(f'<li id="item-{i}">Item {i}</li>' for i in range(40)) + "</ul>"
+        
+        results = generator.generate_from_fragment(fragment, targeting_mode="all")
+        
+        # The wrapper's head and title come first, as in any complete document
+        assert list(results) == [f"element_{i}" for i in range(43)]
+        assert results["element_2"]["element_tag"] == "ul"
+        assert [results[f"element_{i + 3}"]["element_text"] for i in range(40)] == [
+            f"Item {i}" for i in range(40)
+        ]
+
+    def test_generate_from_fragment_returns_independent_cached_results(self, generator):
+        """Test that repeated calls return equal results that do not share state."""
+        fragment = """<div>
+    <button id="submit-btn">Submit</button>
+</div>"""
+        
+        first = generator.generate_from_fragment(fragment, targeting_mode="auto")
+        first["element_0"]["selectors"].clear()
+        second = generator.generate_from_fragment(fragment, targeting_mode="auto")
+        
+        assert second["element_0"]["element_tag"] == "button"
+        assert second["element_0"]["selectors"]
+
+    def test_auto_detection_follows_updated_test_attributes(self):
+        """Test that changes to test_attributes after construction affect auto-detection."""
+        generator = SelectorGenerator()
+        fragment = '<div><span data-foo="1">Tagged</span><button>Go</button></div>'
+        
+        assert len(generator.generate_from_fragment(fragment, targeting_mode="auto")) == 1
+        
+        generator.test_attributes.append("data-foo")
+        results = generator.generate_from_fragment(fragment, targeting_mode="auto")
+        
+        assert [result["element_tag"] for result in results.values()] == ["span", "button"]
+
+    def test_large_fragments_are_not_kept_in_caches(self, generator):
+        """Test that fragments above the cache limit are wrapped and parsed without caching."""
+        fragment = "<div>" + "x" * (selector_generator._CACHE_MAX_CONTENT + 1) + "</div>"
+        wrap_cache_size = selector_generator._wrap_fragment_cached.cache_info().currsize
+        
+        wrapped = generator.wrap_html_fragment(fragment)
+        tree = selector_generator._parse_html(wrapped)
+        
+        assert tree.find("body/div") is not None
+        assert wrapped not in selector_generator._PARSE_CACHE
+        assert selector_generator._wrap_fragment_cached.cache_info().currsize == wrap_cache_size
+
+    def test_parse_html_misses_are_not_cached(self):
+        """Test that _parse_html parses unknown content once without caching it."""
+        document = "<html><body><p>Uncached document</p></body></html>"
+        
+        tree = selector_generator._parse_html(document)
+        
+        assert tree.find("body/p").text == "Uncached document"
+        assert document not in selector_generator._PARSE_CACHE
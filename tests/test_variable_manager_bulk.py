@@ -2,46 +2,58 @@
 Tests for the variable manager bulk operations.
 """
 
-import json
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from src.automata.utils.variables import VariableManager
 from src.automata.core.errors import AutomationError
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def variable_manager():
-    """Create a variable manager for testing."""
+    """Create a variable manager shared by the tests of a class."""
     return VariableManager()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_variable_manager(variable_manager):
+    """Empty the shared variable manager after each test."""
+    yield
+    variable_manager.variables.clear()
+    variable_manager.variable_history.clear()
+
+
+# Session-scoped sample data is wrapped read-only at the top level only; nested dicts and
+# lists are still shared between tests, so tests must copy them before mutating
+@pytest.fixture(scope="session")
 def sample_credentials():
     """Create sample credentials for testing."""
-    return {
+    return MappingProxyType({
         "username": "testuser",
         "password": "testpass123",
         "email": "testuser@example.com",
         "api_key": "sk-test123456789"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config():
     """Create sample config for testing."""
-    return {
+    return MappingProxyType({
         "base_url": "https://api.example.com",
         "timeout": 30,
         "retries": 3,
         "debug": False
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_custom_fields():
     """Create sample custom fields for testing."""
-    return {
+    return MappingProxyType({
         "user_id": "12345",
         "account_type": "premium",
         "preferences": {
@@ -53,13 +65,13 @@ def sample_custom_fields():
             "created_at": "2023-01-01T00:00:00Z",
             "updated_at": "2023-01-02T00:00:00Z"
         }
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_workflow_with_variables():
     """Create a sample workflow with variables for testing."""
-    return {
+    return MappingProxyType({
         "name": "Test Workflow",
         "version": "1.0.0",
         "description": "A test workflow with variables",
@@ -95,7 +107,23 @@ def sample_workflow_with_variables():
                 "selector": "#submit"
             }
         ]
-    }
+    })
+
+
+def _raise_test_error(*args, **kwargs):
+    """Stand-in for a VariableManager method that always fails."""
+    raise Exception("Test error")
+
+
+def _substitute(variable_manager, value):
+    """Substitute variables in every string leaf of nested dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: _substitute(variable_manager, item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(variable_manager, item) for item in value]
+    if isinstance(value, str):
+        return variable_manager.substitute_variables(value)
+    return value
 
 
 class TestVariableManagerBulkOperations:
@@ -134,24 +162,44 @@ class TestVariableManagerBulkOperations:
             mock_persist.assert_any_call("password", "testpass123")
 
     @pytest.mark.unit
-    def test_bulk_set_variables_with_empty_dict(self, variable_manager):
-        """Test that bulk_set_variables handles empty dictionary correctly."""
-        variable_manager.bulk_set_variables({})
-        
-        # Verify no variables were set
+    @pytest.mark.parametrize(
+        "bulk_method, arg, expected",
+        [
+            ("bulk_set_variables", {}, None),
+            ("bulk_get_variables", [], {}),
+            ("bulk_delete_variables", [], {}),
+            ("inject_variables_from_dict", {}, None),
+        ],
+        ids=["bulk_set", "bulk_get", "bulk_delete", "inject_from_dict"],
+    )
+    def test_bulk_operation_with_empty_input(self, variable_manager, bulk_method, arg, expected):
+        """Test that bulk operations handle empty input without touching variables."""
+        result = getattr(variable_manager, bulk_method)(arg)
+        
+        assert result == expected
         assert len(variable_manager.variables) == 0
 
     @pytest.mark.unit
-    def test_bulk_set_variables_with_exception(self, variable_manager):
-        """Test that bulk_set_variables handles exceptions correctly."""
-        variables = {
-            "username": "testuser",
-            "password": "testpass123"
-        }
-        
-        with patch.object(variable_manager, 'set_variable', side_effect=Exception("Test error")):
-            with pytest.raises(AutomationError, match="Error bulk setting variables"):
-                variable_manager.bulk_set_variables(variables)
+    @pytest.mark.parametrize(
+        "bulk_method, patched, arg, match",
+        [
+            ("bulk_set_variables", "set_variable", {"username": "testuser", "password": "testpass123"},
+             "Error bulk setting variables"),
+            ("bulk_get_variables", "get_variable", ["username", "password"],
+             "Error bulk getting variables"),
+            ("bulk_delete_variables", "delete_variable", ["username", "password"],
+             "Error bulk deleting variables"),
+            ("inject_variables_from_dict", "set_variable", {"username": "testuser", "api_key": "sk-test"},
+             "Error injecting variables from dictionary"),
+        ],
+        ids=["bulk_set", "bulk_get", "bulk_delete", "inject_from_dict"],
+    )
+    def test_bulk_operation_with_exception(self, variable_manager, monkeypatch, bulk_method, patched, arg, match):
+        """Test that bulk operations wrap errors from the per-variable call in AutomationError."""
+        monkeypatch.setattr(variable_manager, patched, _raise_test_error)
+        
+        with pytest.raises(AutomationError, match=match):
+            getattr(variable_manager, bulk_method)(arg)
 
     @pytest.mark.unit
     def test_bulk_get_variables(self, variable_manager):
@@ -187,23 +235,6 @@ class TestVariableManagerBulkOperations:
         assert result["nonexistent1"] is None
         assert result["nonexistent2"] is None
 
-    @pytest.mark.unit
-    def test_bulk_get_variables_with_empty_list(self, variable_manager):
-        """Test that bulk_get_variables handles empty list correctly."""
-        result = variable_manager.bulk_get_variables([])
-        
-        # Verify empty dictionary was returned
-        assert result == {}
-
-    @pytest.mark.unit
-    def test_bulk_get_variables_with_exception(self, variable_manager):
-        """Test that bulk_get_variables handles exceptions correctly."""
-        names = ["username", "password"]
-        
-        with patch.object(variable_manager, 'get_variable', side_effect=Exception("Test error")):
-            with pytest.raises(AutomationError, match="Error bulk getting variables"):
-                variable_manager.bulk_get_variables(names)
-
     @pytest.mark.unit
     def test_bulk_delete_variables(self, variable_manager):
         """Test that bulk_delete_variables deletes multiple variables correctly."""
@@ -241,23 +272,6 @@ class TestVariableManagerBulkOperations:
         assert result["nonexistent1"] is True
         assert result["nonexistent2"] is True
 
-    @pytest.mark.unit
-    def test_bulk_delete_variables_with_empty_list(self, variable_manager):
-        """Test that bulk_delete_variables handles empty list correctly."""
-        result = variable_manager.bulk_delete_variables([])
-        
-        # Verify empty dictionary was returned
-        assert result == {}
-
-    @pytest.mark.unit
-    def test_bulk_delete_variables_with_exception(self, variable_manager):
-        """Test that bulk_delete_variables handles exceptions correctly."""
-        names = ["username", "password"]
-        
-        with patch.object(variable_manager, 'delete_variable', side_effect=Exception("Test error")):
-            with pytest.raises(AutomationError, match="Error bulk deleting variables"):
-                variable_manager.bulk_delete_variables(names)
-
     @pytest.mark.unit
     def test_inject_variables_from_dict(self, variable_manager, sample_credentials):
         """Test that inject_variables_from_dict injects variables correctly."""
@@ -280,21 +294,6 @@ class TestVariableManagerBulkOperations:
         assert variable_manager.get_variable("auth_email") == "testuser@example.com"
         assert variable_manager.get_variable("auth_api_key") == "sk-test123456789"
 
-    @pytest.mark.unit
-    def test_inject_variables_from_dict_with_empty_dict(self, variable_manager):
-        """Test that inject_variables_from_dict handles empty dictionary correctly."""
-        variable_manager.inject_variables_from_dict({})
-        
-        # Verify no variables were injected
-        assert len(variable_manager.variables) == 0
-
-    @pytest.mark.unit
-    def test_inject_variables_from_dict_with_exception(self, variable_manager, sample_credentials):
-        """Test that inject_variables_from_dict handles exceptions correctly."""
-        with patch.object(variable_manager, 'set_variable', side_effect=Exception("Test error")):
-            with pytest.raises(AutomationError, match="Error injecting variables from dictionary"):
-                variable_manager.inject_variables_from_dict(sample_credentials)
-
     @pytest.mark.unit
     def test_extract_variables_to_dict(self, variable_manager, sample_credentials):
         """Test that extract_variables_to_dict extracts variables correctly."""
@@ -338,22 +337,21 @@ class TestVariableManagerBulkOperations:
         assert result == {}
 
     @pytest.mark.unit
-    def test_extract_variables_to_dict_with_exception(self, variable_manager, sample_credentials):
+    def test_extract_variables_to_dict_with_exception(self, variable_manager, monkeypatch, sample_credentials):
         """Test that extract_variables_to_dict handles exceptions correctly."""
         # Inject variables
         variable_manager.inject_variables_from_dict(sample_credentials)
         
-        with patch.object(variable_manager, 'list_variables', side_effect=Exception("Test error")):
-            with pytest.raises(AutomationError, match="Error extracting variables to dictionary"):
-                variable_manager.extract_variables_to_dict()
+        monkeypatch.setattr(variable_manager, "list_variables", _raise_test_error)
+        
+        with pytest.raises(AutomationError, match="Error extracting variables to dictionary"):
+            variable_manager.extract_variables_to_dict()
 
     @pytest.mark.unit
     def test_substitute_variables_with_credentials(self, variable_manager, sample_credentials, sample_config, sample_custom_fields):
         """Test that substitute_variables works with injected credentials."""
-        # Inject credentials, config, and custom fields
-        variable_manager.bulk_set_variables(sample_credentials)
-        variable_manager.bulk_set_variables(sample_config)
-        variable_manager.bulk_set_variables(sample_custom_fields)
+        # Inject credentials, config, and custom fields in one call
+        variable_manager.bulk_set_variables({**sample_credentials, **sample_config, **sample_custom_fields})
         
         # Test substitution with various formats
         text1 = "Username: ${username}, Password: $password"
@@ -389,9 +387,7 @@ class TestVariableManagerBulkOperations:
         variable_manager.set_variable("notifications", "True")
         
         # Substitute variables in workflow
-        workflow_json = json.dumps(sample_workflow_with_variables)
-        substituted_json = variable_manager.substitute_variables(workflow_json)
-        substituted_workflow = json.loads(substituted_json)
+        substituted_workflow = _substitute(variable_manager, sample_workflow_with_variables)
         
         # Verify variables were substituted correctly
         assert substituted_workflow["variables"]["username"] == "testuser"
@@ -2,30 +2,76 @@
 Unit tests for the workflow validator component.
 """
 
+import copy
+import json
+
 import pytest
 from src.automata.workflow.validator import WorkflowValidator
 from src.automata.workflow.schema import WorkflowSchema
 from src.automata.core.errors import AutomationError
 
+# Minimal valid workflow; the invalid-workflow cases each deep-copy and break one field
+_VALID_WORKFLOW = {
+    "name": "Test Workflow",
+    "version": "1.0.0",
+    "description": "A test workflow",
+    "variables": {},
+    "steps": [
+        {
+            "name": "Step 1",
+            "action": "navigate",
+            "value": "https://example.com"
+        }
+    ]
+}
+
+# Workflow without a name, serialized once at import
+_INVALID_WORKFLOW_JSON = json.dumps({
+    "version": "1.0.0",
+    "description": "A test workflow",
+    "variables": {},
+    "steps": []
+})
+
+
+def _has_error(validator, text):
+    """Whether any validation error contains text (newlines keep matches within one error)."""
+    return text in "\n".join(validator.errors)
+
+
+@pytest.fixture(scope="class")
+def schema():
+    """One WorkflowSchema per class; validators only read it."""
+    return WorkflowSchema()
+
+
+@pytest.fixture
+def validator(schema):
+    """Fresh WorkflowValidator per test over the shared schema."""
+    return WorkflowValidator(schema)
+
+
+@pytest.fixture(scope="session")
+def invalid_workflow_file(tmp_path_factory):
+    """Workflow file missing its name, written once per session."""
+    path = tmp_path_factory.mktemp("workflows") / "invalid_workflow.json"
+    path.write_text(_INVALID_WORKFLOW_JSON, encoding="utf-8")
+    return str(path)
+
 
 @pytest.mark.unit
 class TestWorkflowValidator:
     """Test cases for WorkflowValidator."""
 
-    def test_init(self):
+    def test_init(self, schema, validator):
         """Test WorkflowValidator initialization."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
         assert validator is not None
         assert validator.schema is schema
         assert validator.errors == []
         assert validator.warnings == []
 
-    def test_validate_workflow_valid(self):
+    def test_validate_workflow_valid(self, validator):
         """Test validating a valid workflow."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
         # Valid workflow
         workflow = {
             "name": "Test Workflow",
@@ -48,24 +94,22 @@ class TestWorkflowValidator:
         assert is_valid is True
         assert validator.errors == []
 
-    def test_validate_workflow_missing_name(self):
-        """Test validating a workflow with missing name."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
-        # Invalid workflow (missing name)
-        workflow = {
-            "version": "1.0.0",
-            "description": "A test workflow",
-            "variables": {},
-            "steps": [
-                {
-                    "name": "Step 1",
-                    "action": "navigate",
-                    "value": "https://example.com"
-                }
-            ]
-        }
+    @pytest.mark.parametrize(
+        "mutate, expected",
+        [
+            (lambda w: w.pop("name"), "name"),
+            (lambda w: w.pop("version"), "version"),
+            (lambda w: w.pop("steps"), "steps"),
+            (lambda w: w.__setitem__("steps", []), "steps"),
+            (lambda w: w["steps"][0].pop("action"), "action"),
+            (lambda w: w["steps"][0].__setitem__("action", "invalid_action"), "invalid_action"),
+        ],
+        ids=["missing_name", "missing_version", "missing_steps", "empty_steps", "invalid_step", "invalid_action"],
+    )
+    def test_validate_workflow_invalid(self, validator, mutate, expected):
+        """Test validating a workflow with a missing or invalid field."""
+        workflow = copy.deepcopy(_VALID_WORKFLOW)
+        mutate(workflow)
         
         # Test
         is_valid = validator.validate_workflow(workflow)
@@ -73,139 +117,11 @@ class TestWorkflowValidator:
         # Verify
         assert is_valid is False
         assert len(validator.errors) > 0
-        assert any("name" in error for error in validator.errors)
+        assert _has_error(validator, expected)
 
-    def test_validate_workflow_missing_version(self):
-        """Test validating a workflow with missing version."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
-        # Invalid workflow (missing version)
-        workflow = {
-            "name": "Test Workflow",
-            "description": "A test workflow",
-            "variables": {},
-            "steps": [
-                {
-                    "name": "Step 1",
-                    "action": "navigate",
-                    "value": "https://example.com"
-                }
-            ]
-        }
-        
-        # Test
-        is_valid = validator.validate_workflow(workflow)
-        
-        # Verify
-        assert is_valid is False
-        assert len(validator.errors) > 0
-        assert any("version" in error for error in validator.errors)
-
-    def test_validate_workflow_missing_steps(self):
-        """Test validating a workflow with missing steps."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
-        # Invalid workflow (missing steps)
-        workflow = {
-            "name": "Test Workflow",
-            "version": "1.0.0",
-            "description": "A test workflow",
-            "variables": {}
-        }
-        
-        # Test
-        is_valid = validator.validate_workflow(workflow)
-        
-        # Verify
-        assert is_valid is False
-        assert len(validator.errors) > 0
-        assert any("steps" in error for error in validator.errors)
-
-    def test_validate_workflow_empty_steps(self):
-        """Test validating a workflow with empty steps."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
-        # Invalid workflow (empty steps)
-        workflow = {
-            "name": "Test Workflow",
-            "version": "1.0.0",
-            "description": "A test workflow",
-            "variables": {},
-            "steps": []
-        }
-        
-        # Test
-        is_valid = validator.validate_workflow(workflow)
-        
-        # Verify
-        assert is_valid is False
-        assert len(validator.errors) > 0
-        assert any("steps" in error for error in validator.errors)
-
-    def test_validate_workflow_invalid_step(self):
-        """Test validating a workflow with invalid step."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
-        # Invalid workflow (invalid step)
-        workflow = {
-            "name": "Test Workflow",
-            "version": "1.0.0",
-            "description": "A test workflow",
-            "variables": {},
-            "steps": [
-                {
-                    "name": "Step 1",
-                    "value": "https://example.com"
-                    # Missing action
-                }
-            ]
-        }
-        
-        # Test
-        is_valid = validator.validate_workflow(workflow)
-        
-        # Verify
-        assert is_valid is False
-        assert len(validator.errors) > 0
-        assert any("action" in error for error in validator.errors)
-
-    def test_validate_workflow_invalid_action(self):
-        """Test validating a workflow with invalid action."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
-        # Invalid workflow (invalid action)
-        workflow = {
-            "name": "Test Workflow",
-            "version": "1.0.0",
-            "description": "A test workflow",
-            "variables": {},
-            "steps": [
-                {
-                    "name": "Step 1",
-                    "action": "invalid_action",
-                    "value": "https://example.com"
-                }
-            ]
-        }
-        
-        # Test
-        is_valid = validator.validate_workflow(workflow)
-        
-        # Verify
-        assert is_valid is False
-        assert len(validator.errors) > 0
-        assert any("invalid_action" in error for error in validator.errors)
-
-    def test_validate_workflow_file_valid(self, sample_workflow_file):
+    @pytest.mark.slow
+    def test_validate_workflow_file_valid(self, validator, sample_workflow_file):
         """Test validating a valid workflow file."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
         # Test
         is_valid = validator.validate_workflow_file(sample_workflow_file)
         
@@ -213,47 +129,25 @@ class TestWorkflowValidator:
         assert is_valid is True
         assert validator.errors == []
 
-    def test_validate_workflow_file_invalid(self, temp_dir):
+    @pytest.mark.slow
+    def test_validate_workflow_file_invalid(self, validator, invalid_workflow_file):
         """Test validating an invalid workflow file."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
-        # Create invalid workflow file
-        import json
-        import os
-        invalid_workflow = {
-            "version": "1.0.0",
-            "description": "A test workflow",
-            "variables": {},
-            "steps": []
-            # Missing name
-        }
-        
-        workflow_file = os.path.join(temp_dir, "invalid_workflow.json")
-        with open(workflow_file, "w") as f:
-            json.dump(invalid_workflow, f)
-        
         # Test
-        is_valid = validator.validate_workflow_file(workflow_file)
+        is_valid = validator.validate_workflow_file(invalid_workflow_file)
         
         # Verify
         assert is_valid is False
         assert len(validator.errors) > 0
 
-    def test_validate_workflow_file_nonexistent(self):
+    @pytest.mark.slow
+    def test_validate_workflow_file_nonexistent(self, validator):
         """Test validating a nonexistent workflow file."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
         # Test
         with pytest.raises(AutomationError, match="Workflow file not found"):
             validator.validate_workflow_file("nonexistent_file.json")
 
-    def test_has_errors(self):
+    def test_has_errors(self, validator):
         """Test has_errors method."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
         # Initially no errors
         assert validator.has_errors() is False
         
@@ -263,11 +157,8 @@ class TestWorkflowValidator:
         # Now has errors
         assert validator.has_errors() is True
 
-    def test_has_warnings(self):
+    def test_has_warnings(self, validator):
         """Test has_warnings method."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
         # Initially no warnings
         assert validator.has_warnings() is False
         
@@ -277,11 +168,8 @@ class TestWorkflowValidator:
         # Now has warnings
         assert validator.has_warnings() is True
 
-    def test_print_errors(self, capsys):
+    def test_print_errors(self, validator, capsys):
         """Test print_errors method."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
         # Add errors
         validator.errors = ["Error 1", "Error 2"]
         
@@ -293,11 +181,8 @@ class TestWorkflowValidator:
         assert "Error 1" in captured.out
         assert "Error 2" in captured.out
 
-    def test_print_warnings(self, capsys):
+    def test_print_warnings(self, validator, capsys):
         """Test print_warnings method."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
         # Add warnings
         validator.warnings = ["Warning 1", "Warning 2"]
         
@@ -309,11 +194,8 @@ class TestWorkflowValidator:
         assert "Warning 1" in captured.out
         assert "Warning 2" in captured.out
 
-    def test_clear_errors(self):
+    def test_clear_errors(self, validator):
         """Test clear_errors method."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
         # Add errors
         validator.errors = ["Error 1", "Error 2"]
         validator.warnings = ["Warning 1", "Warning 2"]
@@ -325,11 +207,8 @@ class TestWorkflowValidator:
         assert validator.errors == []
         assert validator.warnings == []
 
-    def test_strict_validation(self):
+    def test_strict_validation(self, validator):
         """Test strict validation mode."""
-        schema = WorkflowSchema()
-        validator = WorkflowValidator(schema)
-        
         # Valid workflow
         workflow = {
             "name": "Test Workflow",